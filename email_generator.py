@@ -5,12 +5,40 @@ This script reads contact information from a Google Sheet, generates personalize
 Google Form pre-fill URLs, and creates HTML email content with inline images.
 """
 
+import functools
+import hashlib
+import html
 import json
 import os
+import re
+import string
+import sys
 import urllib.parse
+from datetime import datetime, timedelta, timezone
 
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+
+# Parsed config.json keyed on (path, mtime_ns) so repeated calls skip the re-parse
+_CONFIG_CACHE = {}
+
+# Keys every script relies on; checked once when config.json is parsed
+REQUIRED_CONFIG_KEYS = (
+    'sheet_id', 'master_sheet_tab', 'form_base_url',
+    'name_field_id', 'grant_deadline', 'image_url'
+)
+
+# Accepted header names for the name column, compared after strip().lower()
+NAME_COLUMN_HEADERS = frozenset({'name', 'full name'})
+
+# Email validation regex pattern, shared by every script so they all accept
+# the same addresses
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', re.ASCII)
+
+# Google API access tokens cached between runs to skip the JWT exchange; one
+# file per service account key and scope set
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'grant_tracker')
+
+# Cached tokens this close to expiry are treated as expired
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
 
 
 def load_config():
@@ -18,7 +46,9 @@ def load_config():
     Load configuration from config.json file.
     
     Reads the config.json file from the project root and returns it as a dictionary.
-    Includes error handling for missing file and JSON parsing errors.
+    The parsed result is cached and reused until the file's modification time changes.
+    Includes error handling for missing file, JSON parsing errors, and missing keys,
+    so a bad config fails at load time instead of partway through a run.
     
     Returns:
         dict: Configuration dictionary containing all settings
@@ -26,34 +56,96 @@ def load_config():
     Raises:
         FileNotFoundError: If config.json does not exist
         json.JSONDecodeError: If config.json contains invalid JSON
+        ValueError: If config.json is missing any of REQUIRED_CONFIG_KEYS
     """
     config_path = 'config.json'
     
-    # Check if config file exists
-    if not os.path.exists(config_path):
+    # Single stat call doubles as the existence check and the cache key
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Configuration file '{config_path}' not found. "
             "Please create config.json in the project root."
         )
     
+    cache_key = (config_path, mtime)
+    if cache_key in _CONFIG_CACHE:
+        return _CONFIG_CACHE[cache_key]
+    
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        return config
+        # json.loads accepts raw bytes and detects the UTF encoding itself,
+        # so the text-mode decode layer is skipped entirely
+        with open(config_path, 'rb') as f:
+            config = json.loads(f.read())
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(
             f"Error parsing config.json: {e.msg}",
             e.doc,
             e.pos
         )
+    
+    if not isinstance(config, dict):
+        raise ValueError("config.json must contain a JSON object at the top level.")
+    
+    missing = [key for key in REQUIRED_CONFIG_KEYS if key not in config]
+    if missing:
+        raise ValueError(
+            f"config.json is missing required setting(s): {', '.join(missing)}"
+        )
+    
+    _CONFIG_CACHE.clear()
+    _CONFIG_CACHE[cache_key] = config
+    return config
 
 
+def form_url_prefix(form_base_url, name_field_id):
+    """
+    Build the constant part of a Google Form pre-fill URL.
+    
+    Everything before the encoded name is the same for every recipient, so
+    callers generating many URLs can compute this once and append
+    encode_form_value(name) per person.
+    
+    Args:
+        form_base_url (str): The base URL of the Google Form
+        name_field_id (str): The entry ID of the name field in the Google Form
+        
+    Returns:
+        str: URL prefix ending in "entry.FIELD_ID="
+    """
+    # Format: base_url?usp=pp_url&entry.FIELD_ID=
+    return f"{form_base_url}?usp=pp_url&entry.{name_field_id}="
+
+
+def encode_form_value(value):
+    """
+    URL-encode a value for a Google Form pre-fill parameter.
+    
+    Spaces become '+' as Google Forms expects. Plain ASCII letters/digits
+    (the common case) need no escaping, so the quoter is skipped for those.
+    
+    Args:
+        value (str): Value to encode (e.g., a person's name)
+        
+    Returns:
+        str: Encoded value safe to append to a pre-fill URL
+    """
+    if value.isascii() and value.replace(' ', '').isalnum():
+        return value.replace(' ', '+')
+    # Same result as quote_plus, but quoting the UTF-8 bytes directly skips
+    # quote()'s str-encoding dispatch; spaces are kept safe and then swapped for '+'
+    return urllib.parse.quote_from_bytes(value.encode('utf-8'), safe=b' ').replace(' ', '+')
+
+
+@functools.lru_cache(maxsize=4096)
 def generate_form_url(name, form_base_url, name_field_id):
     """
     Generate a Google Form pre-fill URL with the person's name pre-filled.
     
     Google Forms supports pre-filling form fields using URL parameters.
     The format is: base_url + "?usp=pp_url&entry." + field_id + "=" + encoded_value
+    Results are memoized, so repeated names cost a single cache lookup.
     
     Args:
         name (str): The person's name to pre-fill in the form
@@ -67,40 +159,13 @@ def generate_form_url(name, form_base_url, name_field_id):
         >>> generate_form_url("John Doe", "https://forms.google.com/form", "123456")
         'https://forms.google.com/form?usp=pp_url&entry.123456=John+Doe'
     """
-    # URL encode the name to handle special characters and spaces
-    # This converts spaces to '+' or '%20' and handles special characters
-    encoded_name = urllib.parse.quote(name)
-    
-    # Construct the pre-fill URL
-    # Format: base_url?usp=pp_url&entry.FIELD_ID=ENCODED_VALUE
-    prefill_url = f"{form_base_url}?usp=pp_url&entry.{name_field_id}={encoded_name}"
-    
-    return prefill_url
+    return form_url_prefix(form_base_url, name_field_id) + encode_form_value(name)
 
 
-def create_email_body(name, form_url, grant_deadline, image_url):
-    """
-    Create HTML email body with personalized content and inline image.
-    
-    Generates a mobile-responsive HTML email template with:
-    - Personalized greeting
-    - Grant information about Historic Holliday Park alleys
-    - Inline image display
-    - Call-to-action button linking to the form
-    - Deadline urgency message
-    
-    Args:
-        name (str): Recipient's name for personalization
-        form_url (str): Pre-filled Google Form URL for the call-to-action
-        grant_deadline (str): Deadline date for the grant application
-        image_url (str): URL of the image to display inline in the email
-        
-    Returns:
-        str: Complete HTML email body as a string
-    """
-    # HTML email template with inline CSS for email client compatibility
-    # Using inline styles ensures better rendering across different email clients
-    email_html = f"""<!DOCTYPE html>
+# HTML email template with inline CSS for email client compatibility
+# Using inline styles ensures better rendering across different email clients
+# Compiled once as a string.Template; literal dollar signs are written as $$
+_EMAIL_TEMPLATE = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -120,7 +185,7 @@ def create_email_body(name, form_url, grant_deadline, image_url):
                     <tr>
                         <td style="padding: 30px 30px 20px 30px;">
                             <h1 style="margin: 0; color: #333333; font-size: 24px;">
-                                Hi {name},
+                                Hi ${name},
                             </h1>
                         </td>
                     </tr>
@@ -151,7 +216,7 @@ def create_email_body(name, form_url, grant_deadline, image_url):
 
                             <!-- Value callout -->
                             <p style="margin: 0 0 15px 0; color: #555555; font-size: 16px; line-height: 1.6;">
-                                <strong>Total Value: $783,000</strong> | <strong>Cost to You: $0</strong>
+                                <strong>Total Value: $$783,000</strong> | <strong>Cost to You: $$0</strong>
                             </p>
 
                             <!-- Track record -->
@@ -159,8 +224,8 @@ def create_email_body(name, form_url, grant_deadline, image_url):
                                 <strong>Our Track Record:</strong>
                             </p>
                             <ul style="margin: 0 0 15px 0; padding-left: 20px; color: #555555; font-size: 16px; line-height: 1.6;">
-                                <li style="margin-bottom: 5px;"><strong>2023:</strong> Strong community support → $1.2M grant won (construction starts early 2026)</li>
-                                <li style="margin-bottom: 5px;"><strong>2024:</strong> Low engagement → $330K proposal withdrawn</li>
+                                <li style="margin-bottom: 5px;"><strong>2023:</strong> Strong community support → $$1.2M grant won (construction starts early 2026)</li>
+                                <li style="margin-bottom: 5px;"><strong>2024:</strong> Low engagement → $$330K proposal withdrawn</li>
                             </ul>
 
                             <!-- Inline image with responsive styling -->
@@ -168,7 +233,7 @@ def create_email_body(name, form_url, grant_deadline, image_url):
                                    style="margin: 20px 0;">
                                 <tr>
                                     <td align="center">
-                                        <img src="{image_url}"
+                                        <img src="${image_url}"
                                              alt="Grant Information"
                                              style="max-width: 100%; height: auto; border-radius: 4px; display: block;"
                                              width="540">
@@ -201,7 +266,7 @@ def create_email_body(name, form_url, grant_deadline, image_url):
                             <table role="presentation" cellpadding="0" cellspacing="0">
                                 <tr>
                                     <td align="center" style="background-color: #007bff; border-radius: 5px;">
-                                        <a href="{form_url}"
+                                        <a href="${form_url}"
                                            style="display: inline-block; padding: 14px 30px; color: #ffffff;
                                                   text-decoration: none; font-size: 16px; font-weight: bold;
                                                   border-radius: 5px;">
@@ -217,7 +282,7 @@ def create_email_body(name, form_url, grant_deadline, image_url):
                     <tr>
                         <td style="padding: 0 30px 30px 30px;">
                             <p style="margin: 0; color: #d9534f; font-size: 14px; font-weight: bold; text-align: center;">
-                                Please respond by {grant_deadline}
+                                Please respond by ${grant_deadline}
                             </p>
                         </td>
                     </tr>
@@ -228,8 +293,192 @@ def create_email_body(name, form_url, grant_deadline, image_url):
     </table>
 </body>
 </html>
-"""
-    return email_html
+""")
+
+
+@functools.lru_cache(maxsize=16)
+def campaign_template(grant_deadline, image_url):
+    """
+    Pre-render the campaign-wide parts of the email template.
+    
+    The deadline and image URL are the same for every recipient, so they are
+    filled in once and the returned template only needs ``name`` and
+    ``form_url`` per email.
+    
+    Args:
+        grant_deadline (str): Deadline date for the grant application
+        image_url (str): URL of the image to display inline in the email
+        
+    Returns:
+        string.Template: Template with ${name} and ${form_url} placeholders
+    """
+    source = _EMAIL_TEMPLATE.template
+    # Escape dollar signs in the values so they stay literal in the new template
+    source = source.replace('${grant_deadline}', grant_deadline.replace('$', '$$'))
+    source = source.replace('${image_url}', image_url.replace('$', '$$'))
+    return string.Template(source)
+
+
+def create_email_body(name, form_url, grant_deadline, image_url):
+    """
+    Create HTML email body with personalized content and inline image.
+    
+    Generates a mobile-responsive HTML email template with:
+    - Personalized greeting
+    - Grant information about Historic Holliday Park alleys
+    - Inline image display
+    - Call-to-action button linking to the form
+    - Deadline urgency message
+    
+    Args:
+        name (str): Recipient's name for personalization (HTML-escaped here)
+        form_url (str): Pre-filled Google Form URL for the call-to-action
+        grant_deadline (str): Deadline date for the grant application
+        image_url (str): URL of the image to display inline in the email
+        
+    Returns:
+        str: Complete HTML email body as a string
+    """
+    # Names come straight from the sheet; escape them once here so markup
+    # characters can't break (or inject into) the HTML
+    return campaign_template(grant_deadline, image_url).substitute(
+        name=html.escape(name),
+        form_url=form_url
+    )
+
+
+def _token_identity(key_data, scope):
+    """
+    Describe which service account key and scopes a cached token belongs to.
+    
+    Args:
+        key_data (dict): Parsed Service Account credentials JSON
+        scope (list): OAuth scopes requested
+        
+    Returns:
+        dict: client_email, private_key_id and sorted scopes
+    """
+    return {
+        'client_email': key_data.get('client_email', ''),
+        'private_key_id': key_data.get('private_key_id', ''),
+        'scopes': sorted(scope),
+    }
+
+
+def _token_cache_path(identity):
+    """
+    Cache file for one key/scope identity, so switching keys or checkouts
+    never picks up another account's token.
+    
+    Args:
+        identity (dict): Result of _token_identity()
+        
+    Returns:
+        str: Path of the token cache file under TOKEN_CACHE_DIR
+    """
+    digest = hashlib.sha256(
+        json.dumps(identity, sort_keys=True).encode('utf-8')
+    ).hexdigest()[:16]
+    return os.path.join(TOKEN_CACHE_DIR, f'token-{digest}.json')
+
+
+def _load_cached_token(identity):
+    """
+    Read a still-valid access token from the local token cache.
+    
+    Args:
+        identity (dict): Result of _token_identity() for the current key and scopes
+        
+    Returns:
+        tuple or None: (token, expires) for the cached access token, or None if
+            missing, unreadable, issued for a different key or scopes, or
+            expiring within TOKEN_EXPIRY_MARGIN
+    """
+    try:
+        with open(_token_cache_path(identity), 'rb') as f:
+            cached = json.loads(f.read())
+        if cached['identity'] != identity:
+            return None
+        expires = datetime.fromisoformat(cached['expires'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    # google-auth reports expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if expires <= now + TOKEN_EXPIRY_MARGIN:
+        return None
+    return cached['token'], expires
+
+
+def _save_cached_token(identity, token, expires):
+    """
+    Write an access token and its expiry to the local token cache (mode 0600).
+    
+    Args:
+        identity (dict): Result of _token_identity() the token was issued for
+        token (str): OAuth access token
+        expires (datetime): Naive UTC expiry time of the token
+    """
+    path = _token_cache_path(identity)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'identity': identity, 'token': token, 'expires': expires.isoformat()}, f)
+
+
+def authorize_client(credentials_path, scope):
+    """
+    Authorize a gspread client, reusing a cached access token when possible.
+    
+    The service account key is always read, and the cached token is only used
+    if it was issued for that same key (client_email and private_key_id) and
+    scope set. On a cache miss the key is exchanged for an access token, and
+    the token is cached so later runs skip the JWT exchange until it expires.
+    A cached token is loaded into the service account credentials, so
+    google-auth still refreshes it if it expires part-way through a run.
+    
+    Args:
+        credentials_path (str): Path to the Service Account credentials JSON
+        scope (list): OAuth scopes to request
+        
+    Returns:
+        gspread.Client: Authorized Google Sheets client
+        
+    Raises:
+        FileNotFoundError: If the credentials file does not exist
+    """
+    # Imported here so the template/URL helpers stay importable without the
+    # Google API client stack, which is slow to load
+    import gspread
+    from google.auth.transport.requests import Request
+    from google.oauth2 import service_account
+    
+    # Read the key file once and hand the parsed dict to google-auth,
+    # instead of a separate existence check followed by a second open
+    try:
+        with open(credentials_path, 'rb') as f:
+            key_data = json.loads(f.read())
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Google Service Account credentials file '{credentials_path}' not found. "
+            "Please download credentials.json from Google Cloud Console and place it in the project root."
+        )
+    
+    # google-auth signs the JWT through the cryptography/OpenSSL bindings
+    credentials = service_account.Credentials.from_service_account_info(key_data, scopes=scope)
+    
+    identity = _token_identity(key_data, scope)
+    cached = _load_cached_token(identity)
+    if cached:
+        credentials.token, credentials.expiry = cached
+        return gspread.authorize(credentials)
+    
+    credentials.refresh(Request())
+    try:
+        _save_cached_token(identity, credentials.token, credentials.expiry)
+    except OSError:
+        pass  # Caching is best-effort; authentication already succeeded
+    return gspread.authorize(credentials)
 
 
 def main():
@@ -240,7 +489,8 @@ def main():
     1. Load configuration from config.json
     2. Authenticate with Google Sheets API using Service Account credentials
     3. Open the specified Google Sheet
-    4. Read the first 5 rows from the master sheet tab
+    4. Read the first max_rows rows (default 5) from the master sheet tab
+       in a single batchGet request
     5. Generate pre-fill URLs for each person
     6. Create and preview email body for the first person
     
@@ -250,126 +500,126 @@ def main():
     - Google Sheets API errors
     - Missing or malformed sheet data
     """
+    # Deferred import: only main() needs the Google Sheets client
+    import gspread
+    
     try:
         # Load configuration
         print("Loading configuration...")
         config = load_config()
         print("Configuration loaded successfully.")
         
-        # Check if credentials file exists
-        credentials_path = 'credentials.json'
-        if not os.path.exists(credentials_path):
-            raise FileNotFoundError(
-                f"Google Service Account credentials file '{credentials_path}' not found. "
-                "Please download credentials.json from Google Cloud Console and place it in the project root."
-            )
-        
         # Set up Google Sheets API authentication
         # Using Service Account credentials for server-to-server authentication
+        # (authorize_client raises FileNotFoundError if credentials.json is missing)
         print("Authenticating with Google Sheets API...")
+        credentials_path = 'credentials.json'
         scope = [
             'https://spreadsheets.google.com/feeds',
             'https://www.googleapis.com/auth/drive'
         ]
         
-        credentials = ServiceAccountCredentials.from_json_keyfile_name(
-            credentials_path,
-            scope
-        )
-        client = gspread.authorize(credentials)
+        client = authorize_client(credentials_path, scope)
         print("Authentication successful.")
         
         # Open the Google Sheet using the sheet ID from config
         print(f"Opening Google Sheet (ID: {config['sheet_id']})...")
         sheet = client.open_by_key(config['sheet_id'])
         
-        # Access the master sheet tab
-        print(f"Accessing worksheet: {config['master_sheet_tab']}...")
-        worksheet = sheet.worksheet(config['master_sheet_tab'])
-        
-        # Read rows from the sheet
-        # Skip header row (index 0), read next 5 data rows
-        print("Reading first 5 data rows from sheet (skipping header)...")
-        all_rows = worksheet.get_all_values()
+        # Read the header row and the first max_rows data rows of the master tab
+        # Bounded ranges keep the download small no matter how large the sheet is,
+        # and values_batch_get fetches both by tab name in a single request
+        max_rows = config.get('max_rows', 5)
+        print(f"Reading first {max_rows} data rows from worksheet "
+              f"'{config['master_sheet_tab']}' (skipping header)...")
+        header_range = gspread.utils.absolute_range_name(config['master_sheet_tab'], 'A1:Z1')
+        data_range = gspread.utils.absolute_range_name(
+            config['master_sheet_tab'],
+            f'A2:Z{max_rows + 1}'
+        )
+        result = sheet.values_batch_get([header_range, data_range])
+        header_values, rows = (
+            value_range.get('values', []) for value_range in result['valueRanges']
+        )
         
-        if len(all_rows) < 2:
+        if not header_values or not rows:
             print("Warning: Sheet appears to be empty or only contains headers.")
             return
         
         # Extract headers from first row
-        headers = all_rows[0]
+        headers = header_values[0]
         print(f"Found columns: {', '.join(headers)}")
         
-        # Skip header row (index 0), read next 5 data rows (indices 1-5)
-        rows = all_rows[1:6]
-        
-        # Try to find the name column (common variations)
-        name_column_index = None
-        name_column_variations = ['name', 'Name', 'NAME', 'full name', 'Full Name', 'FULL NAME']
-        
-        for i, header in enumerate(headers):
-            if header.strip() in name_column_variations:
-                name_column_index = i
-                break
+        # Try to find the name column (case-insensitive, single pass)
+        name_column_index = next(
+            (i for i, header in enumerate(headers)
+             if header.strip().lower() in NAME_COLUMN_HEADERS),
+            None
+        )
         
         if name_column_index is None:
             print("Warning: Could not find a 'name' column. Using first column as name.")
             name_column_index = 0
         
+        # The pre-fill URL prefix is the same for every row; build it once
+        url_prefix = form_url_prefix(config['form_base_url'], config['name_field_id'])
+        
         # Process each data row (header already skipped)
+        # Output is collected and written once after the loop, so URL generation
+        # runs uninterrupted instead of alternating with stdout writes
         print("\n" + "="*60)
         print("Generating form URLs for each person:")
         print("="*60)
         
+        separator = "="*60
+        output = []
+        
+        # Bind loop-invariant lookups to locals (LOAD_FAST instead of global/attribute lookups)
+        append = output.append
+        encode = encode_form_value
+        name_idx = name_column_index
         for i, row in enumerate(rows, start=1):  # Process data rows (header already skipped)
-            try:
-                # Extract name from the row, handling missing columns gracefully
-                if name_column_index < len(row):
-                    name = row[name_column_index].strip()
-                else:
-                    print(f"Row {i}: No name found (row too short)")
-                    continue
-                
-                if not name:
-                    print(f"Row {i}: Empty name field, skipping")
-                    continue
-                
-                # Generate pre-fill URL for this person
-                form_url = generate_form_url(
+            # Extract name from the row, handling missing columns gracefully
+            if name_idx < len(row):
+                name = row[name_idx].strip()
+            else:
+                append(f"Row {i}: No name found (row too short)\n")
+                continue
+            
+            if not name:
+                append(f"Row {i}: Empty name field, skipping\n")
+                continue
+            
+            # Generate pre-fill URL for this person
+            form_url = url_prefix + encode(name)
+            append(f"\nRow {i}: {name}\n  Form URL: {form_url}\n")
+            
+            # For the first person, also generate and preview the email body
+            if i == 1:
+                email_body = create_email_body(
                     name,
-                    config['form_base_url'],
-                    config['name_field_id']
+                    form_url,
+                    config['grant_deadline'],
+                    config['image_url']
+                )
+                append(
+                    f"\n{separator}\nEmail Body Preview (for first person):\n{separator}\n"
+                    f"{email_body}\n{separator}\n"
                 )
-                
-                print(f"\nRow {i}: {name}")
-                print(f"  Form URL: {form_url}")
-                
-                # For the first person, also generate and preview the email body
-                if i == 1:
-                    print("\n" + "="*60)
-                    print("Email Body Preview (for first person):")
-                    print("="*60)
-                    email_body = create_email_body(
-                        name,
-                        form_url,
-                        config['grant_deadline'],
-                        config['image_url']
-                    )
-                    print(email_body)
-                    print("="*60)
-                    
-            except Exception as e:
-                print(f"Error processing row {i}: {str(e)}")
-                continue
+        
+        sys.stdout.write("".join(output))
         
         print("\n" + "="*60)
         print("Email generation complete!")
         print("="*60)
+        sys.stdout.flush()
         
     except FileNotFoundError as e:
         print(f"Error: {e}")
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON in config.json: {e}")
+    except ValueError as e:
+        print(f"Error: {e}")
     except gspread.exceptions.APIError as e:
         print(f"Error: Google Sheets API error: {e}")
     except gspread.exceptions.SpreadsheetNotFound:
@@ -0,0 +1,110 @@
+"""
+Retry Helpers for Grant Tracker
+
+Exponential-backoff retries for transient Gmail SMTP, Google Sheets API and
+network errors, and the batched sheet write every sending script uses to record
+what it sent.
+"""
+
+import smtplib
+import time
+
+# Transient SMTP/Sheets errors are retried with exponential backoff (seconds)
+RETRY_ATTEMPTS = 5
+RETRY_MAX_DELAY = 60
+
+# Sheets API status codes worth retrying (rate limit and server-side hiccups)
+RETRYABLE_API_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient_error(error):
+    """
+    Decide whether an SMTP or Sheets error is worth retrying.
+    
+    Args:
+        error (Exception): Error raised by smtplib, gspread or requests
+        
+    Returns:
+        bool: True for temporary failures (4xx SMTP replies, dropped
+            connections, network timeouts, Sheets rate limits/5xx), False
+            for permanent ones
+    """
+    from gspread.exceptions import APIError
+    from requests.exceptions import ConnectionError as RequestsConnectionError
+    from requests.exceptions import RequestException, Timeout
+    
+    if isinstance(error, APIError):
+        return error.response.status_code in RETRYABLE_API_CODES
+    if isinstance(error, (smtplib.SMTPAuthenticationError, smtplib.SMTPRecipientsRefused)):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPException):
+        return isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError))
+    if isinstance(error, RequestException):
+        return isinstance(error, (RequestsConnectionError, Timeout))
+    # Socket-level failures (resets, timeouts, DNS blips) from either client
+    return isinstance(error, OSError)
+
+
+def call_with_retry(func, *args, **kwargs):
+    """
+    Call func, retrying transient SMTP/Sheets/network errors with exponential backoff.
+    
+    Waits 1, 2, 4, ... seconds (capped at RETRY_MAX_DELAY) between attempts,
+    or the Retry-After the Sheets API asks for on a 429.
+    
+    Args:
+        func (callable): Function to call
+        *args, **kwargs: Passed through to func
+        
+    Returns:
+        Whatever func returns
+        
+    Raises:
+        The last error if it is permanent or RETRY_ATTEMPTS is exhausted
+    """
+    from gspread.exceptions import APIError
+    
+    delay = 1
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        try:
+            return func(*args, **kwargs)
+        except (OSError, APIError) as e:  # smtplib and requests errors are OSErrors
+            if attempt == RETRY_ATTEMPTS or not is_transient_error(e):
+                raise
+            
+            wait = delay
+            if isinstance(e, APIError):
+                retry_after = e.response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    wait = int(retry_after)
+            time.sleep(min(wait, RETRY_MAX_DELAY))
+            delay = min(delay * 2, RETRY_MAX_DELAY)
+
+
+def flush_updates(worksheet, pending_updates):
+    """
+    Write all queued cell updates to the sheet in a single batch_update call.
+    
+    Rate-limit (429), server and network errors are retried via call_with_retry.
+    
+    Args:
+        worksheet (gspread.Worksheet): Worksheet to update
+        pending_updates (list): List of {'range': ..., 'values': [[...]]} dicts;
+            emptied once written
+    """
+    from gspread.exceptions import APIError
+    
+    if not pending_updates:
+        return
+    try:
+        call_with_retry(worksheet.batch_update, pending_updates, value_input_option='USER_ENTERED')
+    except (OSError, APIError):
+        # The emails behind these updates may already be sent; list them so the
+        # sheet can be fixed by hand and nobody gets emailed twice
+        print("Error: Could not record these updates in the sheet:")
+        for update in pending_updates:
+            print(f"  {update['range']}: {update['values'][0][0]}")
+        raise
+    pending_updates.clear()
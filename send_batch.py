@@ -6,27 +6,60 @@ in Google Sheets, and supports batch processing with configurable size.
 """
 
 import argparse
+import html
+import json
 import os
-import re
+import queue
 import smtplib
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.utils import formataddr
+from itertools import islice
 
-import gspread
-from dotenv import load_dotenv
-from oauth2client.service_account import ServiceAccountCredentials
+from email_generator import (
+    EMAIL_PATTERN, campaign_template, encode_form_value, form_url_prefix, load_config
+)
+from retry_utils import call_with_retry, flush_updates
+from smtp_utils import close_smtp_connection, open_smtp_connection
 
-from email_generator import create_email_body, generate_form_url, load_config
-
-# Email validation regex pattern
-EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_email_match = EMAIL_PATTERN.match  # Bound once; called for every address
 
 # Common test/suspicious domains
-SUSPICIOUS_DOMAINS = [
+SUSPICIOUS_DOMAINS = frozenset([
     'example.com', 'example.org', 'test.com', 'localhost',
     'invalid', 'fake.com', 'test.org', 'example.net'
-]
+])
+
+# Message bodies are raw UTF-8 (Content-Transfer-Encoding: 8bit)
+SMTP_MAIL_OPTIONS = ('BODY=8BITMIME',)
+
+
+# Subject line for the initial campaign email
+EMAIL_SUBJECT = "Support Needed: Historic Holliday Park Grant Initiative"
+
+# multipart/alternative boundary; no line of the HTML body starts with "--="
+MIME_BOUNDARY = "===============grant-tracker-campaign=="
+
+# Local file remembering, per sheet, the first row that may still be unsent
+PROGRESS_PATH = '.send_batch_progress.json'
+
+# Parallel SMTP sessions used for sending (kept modest for Gmail's connection limits)
+SMTP_WORKERS = 5
+
+# Sends queued on the worker pool at once; kept small so an interrupted batch
+# leaves little unsent work behind and nothing is sent without being recorded
+SMTP_IN_FLIGHT = SMTP_WORKERS * 2
+
+# Sessions idle longer than this (seconds) are checked with NOOP before reuse,
+# since Gmail drops idle connections after a few minutes
+SMTP_IDLE_CHECK = 60
+
+# Queued sheet writes are flushed in one batch_update once this many ranges accumulate
+UPDATE_FLUSH_SIZE = 100
 
 
 def validate_email_format(email):
@@ -54,6 +87,11 @@ def validate_email_format(email):
     
     email = email.strip()
     
+    # The pattern already enforces every check below, so valid addresses
+    # return after one regex call; the checks only run to explain a failure
+    if _email_match(email):
+        return True, ""
+    
     # Check for spaces
     if ' ' in email:
         return False, "Email contains spaces"
@@ -87,11 +125,7 @@ def validate_email_format(email):
     if len(domain_parts[-1]) < 2:
         return False, "Domain TLD too short (must be at least 2 characters)"
     
-    # Use regex pattern to validate overall format
-    if not EMAIL_PATTERN.match(email):
-        return False, "Email format does not match standard pattern"
-    
-    return True, ""
+    return False, "Email format does not match standard pattern"
 
 
 def is_suspicious_email(email):
@@ -124,9 +158,12 @@ def is_suspicious_email(email):
     local_part = parts[0]
     domain_part = parts[1]
     
-    # Check for test domains
-    for test_domain in SUSPICIOUS_DOMAINS:
-        if domain_part == test_domain or domain_part.endswith('.' + test_domain):
+    # Check for test domains: the domain itself or any parent domain
+    # (mail.example.com -> example.com -> com) is a set lookup
+    labels = domain_part.split('.')
+    for i in range(len(labels)):
+        test_domain = '.'.join(labels[i:])
+        if test_domain in SUSPICIOUS_DOMAINS:
             return True, f"Test domain: {test_domain}"
     
     # Check if local part equals domain part (e.g., test@test.com)
@@ -144,6 +181,421 @@ def is_suspicious_email(email):
     return False, ""
 
 
+def check_emails(emails):
+    """
+    Validate a batch of addresses in one pass, checking each distinct address once.
+    
+    Args:
+        emails (iterable): Email addresses (already stripped)
+        
+    Returns:
+        dict: email -> (is_valid, error_message, is_suspicious, suspicious_reason)
+    """
+    results = {}
+    for email in emails:
+        if email not in results:
+            is_valid, error_msg = validate_email_format(email)
+            is_suspicious, reason = is_suspicious_email(email) if is_valid else (False, "")
+            results[email] = (is_valid, error_msg, is_suspicious, reason)
+    return results
+
+
+def load_start_row(progress_key):
+    """
+    Read the first row worth scanning from the local progress file.
+    
+    Args:
+        progress_key (str): Identifies the sheet/tab the marker belongs to
+        
+    Returns:
+        int: Sheet row to start reading from (2 if no marker is saved)
+    """
+    try:
+        with open(PROGRESS_PATH, 'r', encoding='utf-8') as f:
+            return int(json.load(f).get(progress_key, 2))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 2
+
+
+def save_start_row(progress_key, start_row):
+    """
+    Remember the first row the next run needs to scan.
+    
+    Best effort: failing to write the marker only means a longer scan next time.
+    
+    Args:
+        progress_key (str): Identifies the sheet/tab the marker belongs to
+        start_row (int): Sheet row the next run should start reading from
+    """
+    try:
+        with open(PROGRESS_PATH, 'r', encoding='utf-8') as f:
+            progress = json.load(f)
+        if not isinstance(progress, dict):
+            progress = {}
+    except (OSError, ValueError):
+        progress = {}
+    
+    progress[progress_key] = start_row
+    try:
+        with open(PROGRESS_PATH, 'w', encoding='utf-8') as f:
+            json.dump(progress, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not save progress marker: {e}")
+
+
+def read_unsent_rows(worksheet, start_row, limit):
+    """
+    Find rows with an empty Status and fetch Name/Email for the ones to process.
+    
+    The Status column (E) is read first and scanned only until `limit` unsent
+    rows (plus one, to know whether more remain) are found. Name/Email (A:B)
+    are then fetched in one batchGet for just those rows, topped up from the
+    rows past the last Status value (unsent by definition) if needed.
+    Already-sent rows are never downloaded.
+    
+    The rows past the last Status value are read to the end of the sheet.
+    The API trims trailing blank rows, so the length of that read marks the
+    last row with data even after a long run of blank spacer rows, which
+    are left out of the batch.
+    
+    Args:
+        worksheet (gspread.Worksheet): Master sheet
+        start_row (int): First sheet row to consider (row 1 is the header)
+        limit (int): Maximum number of rows to return
+        
+    Returns:
+        tuple: (rows, more_remaining, next_start_row)
+            - rows (list): Up to `limit` (row_index, [name, email]) tuples
+            - more_remaining (bool): True if unsent rows remain beyond this batch
+            - next_start_row (int): First row a later run still needs to scan
+    """
+    if start_row > worksheet.row_count:
+        return [], False, start_row
+    
+    # The API omits trailing blank rows, so rows past tail_start have no Status
+    status_rows = call_with_retry(worksheet.get, f'E{start_row}:E')
+    tail_start = start_row + len(status_rows)
+    unsent_indexes = list(islice(
+        (
+            row_index
+            for row_index, status_row in enumerate(status_rows, start=start_row)
+            if not (status_row and status_row[0].strip())
+        ),
+        limit + 1
+    ))
+    
+    # Merge consecutive wanted rows into one A1 range each
+    spans = []
+    for row_index in unsent_indexes[:limit]:
+        if spans and spans[-1][1] == row_index - 1:
+            spans[-1][1] = row_index
+        else:
+            spans.append([row_index, row_index])
+    ranges = [f'A{first}:B{last}' for first, last in spans]
+    
+    # Top up from the tail once every unsent row above it fits in the batch
+    read_tail = len(unsent_indexes) <= limit and tail_start <= worksheet.row_count
+    if read_tail:
+        ranges.append(f'A{tail_start}:B')
+    
+    results = call_with_retry(worksheet.batch_get, ranges) if ranges else []
+    
+    rows = []
+    for (first, last), values in zip(spans, results):
+        # Blank rows inside a span come back short or missing; pad with []
+        values = list(values) + [[]] * (last - first + 1 - len(values))
+        rows.extend(zip(range(first, last + 1), values))
+    
+    tail_rows = results[len(spans)] if read_tail else []
+    tail_data = [
+        (row_index, row)
+        for row_index, row in enumerate(tail_rows, start=tail_start)
+        if any(cell.strip() for cell in row)
+    ]
+    tail_needed = limit - len(rows)
+    rows.extend(tail_data[:tail_needed])
+    
+    # The next run starts at the first unsent row left over, or past the data
+    if len(unsent_indexes) > limit:
+        return rows, True, unsent_indexes[limit]
+    if len(tail_data) > tail_needed:
+        return rows, True, tail_data[tail_needed][0]
+    return rows, False, tail_start + len(tail_rows)
+
+
+# Placeholders in the pre-rendered message bytes; NUL never appears in real
+# header or HTML text, so they can't collide with template content
+TO_SLOT = b'\x00to\x00'
+NAME_SLOT = b'\x00name\x00'
+URL_SLOT = b'\x00url\x00'
+
+
+def message_template(sender_name, sender_email, subject, body_template):
+    """
+    Pre-render the whole campaign email to bytes once for the batch.
+    
+    Every message has the same headers, MIME structure (one HTML part) and
+    body apart from the recipient's address, name and form link. The body is
+    sent as 8bit UTF-8, so per recipient only those three slots are filled
+    in with bytes.replace; nothing is re-encoded.
+    
+    Args:
+        sender_name (str): Display name for the From header
+        sender_email (str): Sender's email address
+        subject (str): Subject line
+        body_template (string.Template): Result of campaign_template()
+        
+    Returns:
+        bytes: CRLF-terminated message containing TO_SLOT, NAME_SLOT and URL_SLOT
+    """
+    body = body_template.substitute(
+        name=NAME_SLOT.decode('ascii'),
+        form_url=URL_SLOT.decode('ascii')
+    )
+    head = (
+        f"From: {formataddr((sender_name, sender_email), charset='utf-8')}\r\n"
+        f"To: {TO_SLOT.decode('ascii')}\r\n"
+        f"Subject: {subject}\r\n"
+        f"MIME-Version: 1.0\r\n"
+        f'Content-Type: multipart/alternative; boundary="{MIME_BOUNDARY}"\r\n'
+        f"\r\n"
+        f"--{MIME_BOUNDARY}\r\n"
+        f'Content-Type: text/html; charset="utf-8"\r\n'
+        f"MIME-Version: 1.0\r\n"
+        f"Content-Transfer-Encoding: 8bit\r\n"
+        f"\r\n"
+    )
+    tail = f"\r\n--{MIME_BOUNDARY}--\r\n"
+    body = "\r\n".join(body.splitlines())
+    return (head + body + tail).encode('utf-8')
+
+
+def render_message(template, email_address, name, form_url):
+    """
+    Fill in a message_template() for one recipient.
+    
+    Args:
+        template (bytes): Result of message_template()
+        email_address (str): Recipient address (already validated, ASCII)
+        name (str): Recipient's name (HTML-escaped here)
+        form_url (str): Pre-filled form URL (already percent-encoded, ASCII)
+        
+    Returns:
+        bytes: Complete message ready for SMTP.sendmail
+    """
+    return (
+        template
+        .replace(TO_SLOT, email_address.encode('ascii'))
+        .replace(URL_SLOT, form_url.encode('ascii'))
+        .replace(NAME_SLOT, html.escape(name).encode('utf-8'))
+    )
+
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of authenticated Gmail SMTP sessions shared by worker threads.
+    
+    An SMTP session carries one conversation at a time, so each send checks a
+    session out of the pool and puts it back afterwards. Sessions are opened
+    lazily, never more than max_size, and reused for the rest of the batch.
+    """
+    
+    def __init__(self, sender_email, password, max_size, *idle_connections):
+        """
+        Args:
+            sender_email (str): Gmail address to log in as
+            password (str): Gmail App Password
+            max_size (int): Most sessions to keep open at once
+            *idle_connections (tuple): (smtplib.SMTP, opened_at) pairs from
+                open_timed_connection, already-open sessions to seed the pool with
+        """
+        self.sender_email = sender_email
+        self.password = password
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._idle = queue.Queue()
+        for server, _ in idle_connections:
+            self._idle.put(server)
+        self._opened = len(idle_connections)
+        self._all = [server for server, _ in idle_connections]
+        # session -> time.monotonic() of its last use; seeded sessions count
+        # from when they finished connecting, so one that sat at the
+        # confirmation prompt past Gmail's idle timeout gets NOOP-checked
+        self._last_used = dict(idle_connections)
+    
+    def _connect(self):
+        """Open a new session and register it for cleanup."""
+        server = open_smtp_connection(self.sender_email, self.password)
+        with self._lock:
+            self._all.append(server)
+        return server
+    
+    def _checkout(self):
+        """Take an idle session, open a new one if under max_size, or wait."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_open = self._opened < self.max_size
+            if can_open:
+                self._opened += 1
+        if not can_open:
+            return self._idle.get()
+        
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+    
+    def sendmail(self, to_addr, msg):
+        """
+        Send a pre-serialized message on a pooled session.
+        
+        Reconnects once and retries if Gmail has dropped the session.
+        """
+        server = self._checkout()
+        try:
+            # Probe sessions that sat idle (e.g. behind slow sheet writes)
+            # instead of finding out mid-send that Gmail closed them
+            last_used = self._last_used.get(server)
+            if last_used is not None and time.monotonic() - last_used > SMTP_IDLE_CHECK:
+                try:
+                    alive = server.noop()[0] == 250
+                except smtplib.SMTPServerDisconnected:
+                    alive = False
+                if not alive:
+                    server = self._connect()
+            
+            try:
+                server.sendmail(self.sender_email, [to_addr], msg, SMTP_MAIL_OPTIONS)
+            except smtplib.SMTPServerDisconnected:
+                server = self._connect()
+                server.sendmail(self.sender_email, [to_addr], msg, SMTP_MAIL_OPTIONS)
+            self._last_used[server] = time.monotonic()
+        finally:
+            self._idle.put(server)
+    
+    def close(self):
+        """Quit every session opened by this pool."""
+        for server in self._all:
+            close_smtp_connection(server)
+
+
+def open_timed_connection(sender_email, password):
+    """
+    Open an authenticated Gmail SMTP connection and note when it was ready.
+    
+    Args:
+        sender_email (str): Gmail address to log in as
+        password (str): Gmail App Password
+        
+    Returns:
+        tuple: (server, opened_at) where opened_at is time.monotonic() once
+            login finished
+    """
+    server = open_smtp_connection(sender_email, password)
+    return server, time.monotonic()
+
+
+def close_pending_connection(future):
+    """
+    Quit an SMTP connection opened in the background but never used.
+    
+    Args:
+        future (concurrent.futures.Future): Future returned for open_timed_connection
+    """
+    if future.cancel():
+        return
+    try:
+        server, _ = future.result()
+    except Exception:
+        return  # Connecting failed; nothing to close
+    close_smtp_connection(server)
+
+
+def send_one(smtp_sessions, job):
+    """
+    Send one prepared email and report the outcome.
+    
+    Args:
+        smtp_sessions (SMTPConnectionPool): Shared SMTP sessions
+        job (tuple): (row_index, name, email_address, msg_bytes)
+        
+    Returns:
+        tuple: (row_index, name, email_address, error_message)
+            - error_message (str): Failure description, empty string on success
+    """
+    row_index, name, email_address, msg_bytes = job
+    try:
+        call_with_retry(smtp_sessions.sendmail, email_address, msg_bytes)
+    except smtplib.SMTPAuthenticationError as e:
+        return row_index, name, email_address, f"SMTP Authentication failed: {str(e)}"
+    except smtplib.SMTPException as e:
+        return row_index, name, email_address, f"SMTP error: {str(e)}"
+    except Exception as e:
+        return row_index, name, email_address, f"Unexpected error: {str(e)}"
+    return row_index, name, email_address, ""
+
+
+def send_in_order(executor, smtp_sessions, outgoing, in_flight):
+    """
+    Send prepared emails on the worker pool and yield results in row order.
+    
+    At most SMTP_IN_FLIGHT sends are submitted ahead of the one being
+    waited on. A future stays in `in_flight` until its result has been
+    yielded, so after an interruption the caller can still collect the
+    sends that went out.
+    
+    Args:
+        executor (ThreadPoolExecutor): Worker pool to send on
+        smtp_sessions (SMTPConnectionPool): Shared SMTP sessions
+        outgoing (list): (row_index, name, email_address, msg_bytes) jobs
+        in_flight (collections.deque): Empty deque, filled with pending futures
+        
+    Yields:
+        tuple: Result of send_one for each job, in the order of `outgoing`
+    """
+    for job in outgoing:
+        in_flight.append(executor.submit(send_one, smtp_sessions, job))
+        if len(in_flight) >= SMTP_IN_FLIGHT:
+            result = in_flight[0].result()
+            in_flight.popleft()
+            yield result
+    while in_flight:
+        result = in_flight[0].result()
+        in_flight.popleft()
+        yield result
+
+
+def record_result(result, pending_updates, status_cells, sent_cells, today_date):
+    """
+    Print one send outcome and queue its Status (and SentDate) update.
+    
+    Args:
+        result (tuple): (row_index, name, email_address, error_message) from send_one
+        pending_updates (list): Queued batch_update entries to append to
+        status_cells (dict): row_index -> A1 label of the Status cell
+        sent_cells (dict): row_index -> A1 label of the Status:SentDate pair
+        today_date (str): Date written to SentDate
+        
+    Returns:
+        bool: True if the email was sent
+    """
+    row_index, name, email_address, error_msg = result
+    if error_msg:
+        print(f"Sending to: {name} ({email_address})... ✗ Failed: {error_msg}")
+        pending_updates.append({'range': status_cells[row_index], 'values': [[f"Failed - {error_msg}"]]})
+        return False
+    
+    print(f"Sending to: {name} ({email_address})... ✓ Sent successfully")
+    pending_updates.append({'range': sent_cells[row_index], 'values': [['Sent', today_date]]})
+    return True
+
+
 def main():
     """
     Main function to send batch emails via Gmail SMTP.
@@ -154,7 +606,7 @@ def main():
     3. Connect to Google Sheets
     4. Filter rows with empty Status column
     5. Send emails to selected recipients
-    6. Update Google Sheets with send status
+    6. Update Google Sheets with send status (batched into few API calls)
     7. Print summary of results
     """
     # Parse command-line arguments
@@ -172,7 +624,20 @@ def main():
         action='store_true',
         help='Run in dry-run mode (no emails sent, no sheet updates)'
     )
+    parser.add_argument(
+        '--full-scan',
+        action='store_true',
+        help='Ignore the saved progress marker and scan the whole sheet. '
+             'Needed to pick up rows inserted above the marker or rows whose '
+             'Status was cleared to resend them'
+    )
     args = parser.parse_args()
+    
+    # Deferred imports: the Google client stack and dotenv are slow to load
+    # and aren't needed for --help or argument errors
+    import gspread
+    from dotenv import load_dotenv
+    from google.oauth2.service_account import Credentials
     batch_size = args.size
     
     print("="*60)
@@ -181,6 +646,9 @@ def main():
     print(f"Batch size: {batch_size}")
     print()
     
+    smtp_future = None
+    smtp_sessions = None
+    
     try:
         # Load configuration
         print("Loading configuration...")
@@ -205,6 +673,16 @@ def main():
         
         print("Environment variables loaded successfully.")
         
+        # Start the Gmail TLS/AUTH handshake in the background so it overlaps
+        # with Sheets authentication and reads; it's collected before sending
+        if not args.dry_run:
+            print("Connecting to Gmail SMTP server...")
+            startup = ThreadPoolExecutor(max_workers=1)
+            smtp_future = startup.submit(
+                open_timed_connection, config['sender_email'], gmail_app_password
+            )
+            startup.shutdown(wait=False)
+        
         # Check if credentials file exists
         credentials_path = 'credentials.json'
         if not os.path.exists(credentials_path):
@@ -220,10 +698,7 @@ def main():
             'https://www.googleapis.com/auth/drive'
         ]
         
-        credentials = ServiceAccountCredentials.from_json_keyfile_name(
-            credentials_path,
-            scope
-        )
+        credentials = Credentials.from_service_account_file(credentials_path, scopes=scope)
         client = gspread.authorize(credentials)
         print("Authentication successful.")
         
@@ -235,55 +710,41 @@ def main():
         print(f"Accessing worksheet: {config['master_sheet_tab']}...")
         worksheet = sheet.worksheet(config['master_sheet_tab'])
         
-        # Read all rows from the sheet
+        # Rows above the saved marker were all handled by earlier runs, so
+        # only read from there down (--full-scan starts again at row 2)
+        progress_key = f"{config['sheet_id']}/{config['master_sheet_tab']}"
+        start_row = 2 if args.full_scan else load_start_row(progress_key)
+        
         print("Reading data from sheet...")
-        all_rows = worksheet.get_all_values()
+        if start_row > 2:
+            print(f"Resuming from row {start_row} (use --full-scan to rescan the whole sheet)")
+        rows_to_process, more_remaining, next_start_row = read_unsent_rows(
+            worksheet, start_row, batch_size
+        )
         
-        if len(all_rows) < 2:
-            print("Warning: Sheet appears to be empty or only contains headers.")
+        if next_start_row == start_row:
+            if start_row > 2:
+                print("No new rows since the last run.")
+            else:
+                print("Warning: Sheet appears to be empty or only contains headers.")
             return
         
-        # Column indices based on Master Sheet structure
+        # Column indices within the fetched A:B rows (Master Sheet columns A and B)
         NAME_COLUMN = 0      # Column A
         EMAIL_COLUMN = 1     # Column B
-        STATUS_COLUMN = 4    # Column E
-        SENTDATE_COLUMN = 5  # Column F
-        
-        # Skip header row (index 0), process data rows only
-        # all_rows[0] is the header, all_rows[1:] are data rows
-        data_rows = all_rows[1:]
-        
-        # Filter rows where Status column is empty (not yet sent)
-        # Status column is at index 4 (column E)
-        unsent_rows = []
-        
-        for i, row in enumerate(data_rows):
-            # Calculate actual row index in sheet (i+2 because row 1 is header, row 2 is first data row)
-            row_index = i + 2
-            
-            # Safety check: Skip if Name column contains "Name" (in case header leaked through)
-            if len(row) > 0 and str(row[0]).strip().lower() == 'name':
-                continue
-            
-            # Check if Status column exists and is empty/blank
-            if len(row) > STATUS_COLUMN:
-                status = str(row[STATUS_COLUMN]).strip() if row[STATUS_COLUMN] else ""
-            else:
-                status = ""
-            
-            # Only include rows with empty status
-            if not status:
-                unsent_rows.append((row_index, row))
-        
-        print(f"Found {len(unsent_rows)} rows with empty Status.")
         
-        # Take first N rows based on batch size
-        rows_to_process = unsent_rows[:batch_size]
+        # Scanning stops once the batch is full, so the total is only a lower bound
+        if more_remaining:
+            print(f"Found at least {len(rows_to_process) + 1} rows with empty Status.")
+        else:
+            print(f"Found {len(rows_to_process)} rows with empty Status.")
         print(f"Processing {len(rows_to_process)} rows in this batch.")
         print()
         
         if not rows_to_process:
             print("No rows to process. All emails have been sent or no valid rows found.")
+            if not args.dry_run:
+                save_start_row(progress_key, next_start_row)
             return
         
         # Confirmation prompt (if not dry_run)
@@ -299,165 +760,195 @@ def main():
         # Initialize counters
         sent_count = 0
         failed_count = 0
+        duplicate_count = 0
         
         # Get today's date for SentDate column
         today_date = date.today().strftime('%Y-%m-%d')
         
-        # Process each row
-        print("="*60)
-        print("Sending Emails:")
-        print("="*60)
+        # Status/SentDate writes are queued here and sent with batch_update,
+        # instead of one update_acell API call per cell
+        pending_updates = []
+        
+        # The first connection (opened at startup) must succeed before anything
+        # is sent, so a bad App Password stops the run here; the pool then
+        # opens more sessions as workers need them
+        if smtp_future is not None:
+            smtp_sessions = SMTPConnectionPool(
+                config['sender_email'],
+                gmail_app_password,
+                SMTP_WORKERS,
+                smtp_future.result()
+            )
+        
+        # Everything except the recipient's name and form link is the same for
+        # every email, so render it once before the loop
+        body_template = campaign_template(config['grant_deadline'], config['image_url'])
+        envelope = message_template(
+            config['sender_name'], config['sender_email'], EMAIL_SUBJECT, body_template
+        )
+        form_prefix = form_url_prefix(config['form_base_url'], config['name_field_id'])
+        
+        # A1 labels built once per row: Status (E) alone for failures, and
+        # Status+SentDate (E:F) as one 1x2 range for successful sends
+        status_cells = {row_index: f'E{row_index}' for row_index, _ in rows_to_process}
+        sent_cells = {row_index: f'E{row_index}:F{row_index}' for row_index, _ in rows_to_process}
+        
+        # Check every address in the batch up front (duplicates only once)
+        email_checks = check_emails(
+            row[EMAIL_COLUMN].strip()
+            for _, row in rows_to_process
+            if len(row) > EMAIL_COLUMN
+        )
+        
+        # Validate rows and build messages; sending happens afterwards in parallel
+        outgoing = []  # List of (row_index, name, email_address, msg_bytes)
+        seen_emails = set()  # Lowercased addresses already queued in this batch
+        
+        notes = []  # Per-row validation messages, written after the loop
+        note = notes.append
         
         for row_index, row in rows_to_process:
             try:
                 # Extract name and email from row
+                # Every skipped row with an email gets a Status, since the saved
+                # progress marker moves past it and later runs won't look at it
+                # again; fully blank (spacer) rows are left untouched
                 if len(row) <= NAME_COLUMN:
-                    print(f"Row {row_index}: Missing name column, skipping...")
+                    note(f"Row {row_index}: Missing name column, skipping...")
                     failed_count += 1
                     continue
                 
-                name = row[NAME_COLUMN].strip() if row[NAME_COLUMN] else ""
+                name = row[NAME_COLUMN].strip()
                 
                 if not name:
-                    print(f"Row {row_index}: Empty name field, skipping...")
+                    note(f"Row {row_index}: Empty name field, skipping...")
                     failed_count += 1
+                    has_email = len(row) > EMAIL_COLUMN and row[EMAIL_COLUMN].strip()
+                    if has_email and not args.dry_run:
+                        pending_updates.append({'range': status_cells[row_index], 'values': [["Failed - Missing name"]]})
                     continue
                 
                 if len(row) <= EMAIL_COLUMN:
-                    print(f"Row {row_index} ({name}): Missing email column, skipping...")
+                    note(f"Row {row_index} ({name}): Missing email column, skipping...")
                     failed_count += 1
                     # Update status to indicate missing email
                     if not args.dry_run:
-                        status_cell = f'E{row_index}'
-                        worksheet.update_acell(status_cell, f"Failed - Missing email address")
+                        pending_updates.append({'range': status_cells[row_index], 'values': [["Failed - Missing email address"]]})
                     continue
                 
-                email_address = str(row[EMAIL_COLUMN]).strip() if len(row) > EMAIL_COLUMN else ""
+                email_address = row[EMAIL_COLUMN].strip()
                 
                 if not email_address:
-                    print(f"Row {row_index} ({name}): Empty email field, skipping...")
+                    note(f"Row {row_index} ({name}): Empty email field, skipping...")
                     failed_count += 1
                     # Update status to indicate missing email
                     if not args.dry_run:
-                        status_cell = f'E{row_index}'
-                        worksheet.update_acell(status_cell, f"Failed - Empty email address")
+                        pending_updates.append({'range': status_cells[row_index], 'values': [["Failed - Empty email address"]]})
                     continue
                 
                 # Validate email format (enhanced validation)
-                is_valid, error_msg = validate_email_format(email_address)
+                is_valid, error_msg, is_suspicious, suspicious_reason = email_checks[email_address]
                 if not is_valid:
-                    print(f"Row {row_index} ({name}): Invalid email format ({email_address}) - {error_msg}, skipping...")
+                    note(f"Row {row_index} ({name}): Invalid email format ({email_address}) - {error_msg}, skipping...")
                     failed_count += 1
                     # Update status to indicate invalid email
                     if not args.dry_run:
-                        status_cell = f'E{row_index}'
-                        worksheet.update_acell(status_cell, f"Failed - Invalid email format: {error_msg}")
+                        pending_updates.append({'range': status_cells[row_index], 'values': [[f"Failed - Invalid email format: {error_msg}"]]})
                     continue
                 
+                # Send only once per address; the earliest row wins
+                email_key = email_address.lower()
+                if email_key in seen_emails:
+                    note(f"Row {row_index} ({name}): Duplicate email address ({email_address}), skipping...")
+                    duplicate_count += 1
+                    if not args.dry_run:
+                        pending_updates.append({'range': status_cells[row_index], 'values': [["Skipped - Duplicate email address"]]})
+                    continue
+                seen_emails.add(email_key)
+                
                 # Check for suspicious patterns (warn but allow sending)
-                is_suspicious, suspicious_reason = is_suspicious_email(email_address)
                 if is_suspicious:
-                    print(f"Row {row_index} ({name}): Warning - Suspicious email pattern detected ({email_address}): {suspicious_reason}")
+                    note(f"Row {row_index} ({name}): Warning - Suspicious email pattern detected ({email_address}): {suspicious_reason}")
                     # Note: We still allow sending, but warn the user
                 
-                print(f"Sending to: {name} ({email_address})...", end=' ', flush=True)
-                
                 # Generate personalized form URL
-                form_url = generate_form_url(
-                    name,
-                    config['form_base_url'],
-                    config['name_field_id']
-                )
-                
-                # Create email body HTML
-                email_body_html = create_email_body(
-                    name,
-                    form_url,
-                    config['grant_deadline'],
-                    config['image_url']
-                )
-                
-                # Create email message
-                msg = MIMEMultipart('alternative')
-                msg['From'] = f"{config['sender_name']} <{config['sender_email']}>"
-                msg['To'] = email_address
-                msg['Subject'] = "Support Needed: Historic Holliday Park Grant Initiative"
+                form_url = form_prefix + encode_form_value(name)
                 
-                # Attach HTML body
-                html_part = MIMEText(email_body_html, 'html')
-                msg.attach(html_part)
+                # Create email message from the pre-rendered bytes
+                msg_bytes = render_message(envelope, email_address, name, form_url)
                 
-                # Send email via Gmail SMTP
-                try:
-                    if args.dry_run:
-                        print("  [DRY RUN] Would send email (skipped)")
-                        # Simulate success for dry run
-                        sent_count += 1
-                    else:
-                        # Connect to Gmail SMTP server
-                        server = smtplib.SMTP('smtp.gmail.com', 587)
-                        server.starttls()  # Enable TLS encryption
-                        server.login(config['sender_email'], gmail_app_password)
-                        server.send_message(msg)
-                        server.quit()
-                        
-                        # Update Google Sheet: Mark as Sent
-                        status_cell = f'E{row_index}'
-                        sentdate_cell = f'F{row_index}'
-                        
-                        worksheet.update_acell(status_cell, 'Sent')
-                        worksheet.update_acell(sentdate_cell, today_date)
-                        
-                        print("✓ Sent successfully")
-                        sent_count += 1
-                    
-                except smtplib.SMTPAuthenticationError as e:
-                    error_msg = f"SMTP Authentication failed: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    
-                    # Update status with error message
-                    status_cell = f'E{row_index}'
-                    worksheet.update_acell(status_cell, f"Failed - {error_msg}")
-                    
-                except smtplib.SMTPException as e:
-                    error_msg = f"SMTP error: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    
-                    # Update status with error message
-                    status_cell = f'E{row_index}'
-                    worksheet.update_acell(status_cell, f"Failed - {error_msg}")
-                    
-                except Exception as e:
-                    error_msg = f"Unexpected error: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    
-                    # Update status with error message
-                    status_cell = f'E{row_index}'
-                    worksheet.update_acell(status_cell, f"Failed - {error_msg}")
+                outgoing.append((row_index, name, email_address, msg_bytes))
             
             except Exception as e:
                 # Handle any unexpected errors in processing a row
-                print(f"Row {row_index}: Error processing row - {str(e)}")
+                note(f"Row {row_index}: Error processing row - {str(e)}")
                 failed_count += 1
                 
-                # Try to update status if possible
+                # Queue status update with the processing error
                 if not args.dry_run:
-                    try:
-                        status_cell = f'E{row_index}'
-                        worksheet.update_acell(status_cell, f"Failed - Processing error: {str(e)}")
-                    except:
-                        pass  # If we can't update, continue anyway
+                    pending_updates.append({'range': status_cells[row_index], 'values': [[f"Failed - Processing error: {str(e)}"]]})
                 continue
         
+        # Validation messages are collected and written in one go; there's no
+        # network wait in this loop for per-line output to report on
+        if notes:
+            sys.stdout.write("\n".join(notes) + "\n")
+        
+        # Send the prepared emails
+        print("="*60)
+        print("Sending Emails:")
+        print("="*60)
+        
+        try:
+            if args.dry_run:
+                # Simulate success for dry run; nothing is sent, so write all lines at once
+                sys.stdout.write("".join(
+                    f"Sending to: {name} ({email_address})...   [DRY RUN] Would send email (skipped)\n"
+                    for row_index, name, email_address, msg_bytes in outgoing
+                ))
+                sent_count += len(outgoing)
+            else:
+                # SMTP sends are network-bound, so threads overlap the round-trips;
+                # results come back in row order as they complete
+                executor = ThreadPoolExecutor(max_workers=SMTP_WORKERS)
+                in_flight = deque()
+                try:
+                    for result in send_in_order(executor, smtp_sessions, outgoing, in_flight):
+                        if record_result(result, pending_updates, status_cells, sent_cells, today_date):
+                            sent_count += 1
+                        else:
+                            failed_count += 1
+                        
+                        # Flush periodically so a long batch never holds too many pending writes
+                        if len(pending_updates) >= UPDATE_FLUSH_SIZE:
+                            flush_updates(worksheet, pending_updates)
+                except BaseException:
+                    # A failed flush or Ctrl-C: drop sends that haven't started, let
+                    # running ones finish, and queue their outcomes so the flush
+                    # below records them and the next run doesn't email them again
+                    executor.shutdown(cancel_futures=True)
+                    for future in in_flight:
+                        if not future.cancelled():
+                            record_result(future.result(), pending_updates, status_cells, sent_cells, today_date)
+                    raise
+                finally:
+                    executor.shutdown()
+        finally:
+            # Write whatever is queued, even if sending was interrupted
+            flush_updates(worksheet, pending_updates)
+        
+        # Only advance the marker after the whole batch went through
+        if not args.dry_run:
+            save_start_row(progress_key, next_start_row)
+        
         # Print final summary
         print()
         print("="*60)
         print("Summary:")
         print("="*60)
         print(f"Sent: {sent_count}, Failed: {failed_count}")
+        if duplicate_count:
+            print(f"Skipped duplicates: {duplicate_count}")
         print("="*60)
         
     except FileNotFoundError as e:
@@ -468,8 +959,21 @@ def main():
         print(f"Error: Google Sheets API error: {e}")
     except gspread.exceptions.SpreadsheetNotFound:
         print(f"Error: Google Sheet not found. Please check the sheet_id in config.json.")
+    except smtplib.SMTPAuthenticationError as e:
+        print(f"Error: SMTP Authentication failed: {e}")
+    except smtplib.SMTPException as e:
+        print(f"Error: Could not connect to Gmail SMTP server: {e}")
     except Exception as e:
         print(f"Unexpected error: {type(e).__name__}: {e}")
+    finally:
+        # Close the pool on every exit path, including errors while building
+        # messages; a startup connection that never reached the pool
+        # (cancelled, nothing to send, or an error while reading the sheet)
+        # still needs closing too
+        if smtp_sessions is not None:
+            smtp_sessions.close()
+        elif smtp_future is not None:
+            close_pending_connection(smtp_future)
 
 
 if __name__ == "__main__":
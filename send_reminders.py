@@ -6,38 +6,200 @@ and sends them shorter reminder emails via Gmail SMTP.
 """
 
 import argparse
+import functools
 import os
+import queue
 import smtplib
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from itertools import islice, zip_longest
 
-import gspread
-from dotenv import load_dotenv
-from oauth2client.service_account import ServiceAccountCredentials
+from email_generator import EMAIL_PATTERN, generate_form_url, load_config
+from retry_utils import call_with_retry, flush_updates
+from smtp_utils import close_smtp_connection, open_smtp_ssl_connection
 
-from email_generator import generate_form_url, load_config
+# Reconnect after this many messages so one session stays within Gmail's
+# per-connection limits
+SMTP_MESSAGES_PER_CONNECTION = 100
 
+# Queued ReminderSent writes are flushed in one batch_update once this many
+# accumulate, or once no new write has arrived for UPDATE_FLUSH_INTERVAL seconds
+UPDATE_FLUSH_SIZE = 50
+UPDATE_FLUSH_INTERVAL = 5
 
-def create_reminder_email_body(name, form_url, grant_deadline):
+# Sent reminders waiting for the sheet writer; if Sheets falls this far
+# behind, result handling waits instead of buffering without bound
+UPDATE_QUEUE_SIZE = 256
+
+# Master sheet columns we read, in the order they are fetched
+# (Name, Email, Status, ReminderSent); nothing else is downloaded
+MASTER_COLUMNS = ['A', 'B', 'E', 'G']
+
+# Indices into each fetched row, following MASTER_COLUMNS
+NAME_COLUMN = 0      # Column A
+EMAIL_COLUMN = 1     # Column B
+STATUS_COLUMN = 2    # Column E
+REMINDERSENT_COLUMN = 3  # Column G
+
+
+def reminder_worker(jobs, results, sender_email, password, server=None):
     """
-    Create shorter HTML reminder email body.
+    Send queued reminders on one persistent SMTP session until the queue is empty.
     
-    Generates a concise reminder email template with:
-    - Personalized greeting
-    - Brief reminder message
-    - Call-to-action button linking to the form
-    - Deadline urgency message
+    Transient errors (4xx replies, dropped sessions) are retried with
+    call_with_retry, reopening the session as needed, and the session is
+    recycled every SMTP_MESSAGES_PER_CONNECTION messages.
     
     Args:
-        name (str): Recipient's name for personalization
-        form_url (str): Pre-filled Google Form URL for the call-to-action
-        grant_deadline (str): Deadline date for the grant application
+        jobs (queue.Queue): (row_index, name, email_address, msg) tuples to send
+        results (queue.Queue): Receives (row_index, name, email_address, error_message)
+            per job, with an empty error_message on success, then None once
+            this worker stops
+        sender_email (str): Gmail address to log in as
+        password (str): Gmail App Password
+        server (smtplib.SMTP): Already-open session to start with (optional)
+    """
+    messages_on_connection = 0
+    
+    def send(msg):
+        nonlocal server, messages_on_connection
+        # Recycle the session once it has carried its share of messages
+        if server is not None and messages_on_connection >= SMTP_MESSAGES_PER_CONNECTION:
+            close_smtp_connection(server)
+            server = None
+        if server is None:
+            server = open_smtp_ssl_connection(sender_email, password)
+            messages_on_connection = 0
+        try:
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            server = None  # Reconnect on the next attempt
+            raise
+        messages_on_connection += 1
+    
+    try:
+        while True:
+            try:
+                row_index, name, email_address, msg = jobs.get_nowait()
+            except queue.Empty:
+                return
+            
+            error_msg = ""
+            try:
+                call_with_retry(send, msg)
+            except smtplib.SMTPAuthenticationError as e:
+                error_msg = f"SMTP Authentication failed: {str(e)}"
+            except smtplib.SMTPException as e:
+                error_msg = f"SMTP error: {str(e)}"
+            except Exception as e:
+                error_msg = f"Unexpected error: {str(e)}"
+            
+            results.put((row_index, name, email_address, error_msg))
+    finally:
+        if server is not None:
+            close_smtp_connection(server)
+        results.put(None)
+
+
+def drain_queue(jobs):
+    """Discard every job still waiting in a queue, so workers stop picking up more."""
+    while True:
+        try:
+            jobs.get_nowait()
+        except queue.Empty:
+            return
+
+
+def sheet_writer(worksheet, updates, jobs, errors):
+    """
+    Write queued ReminderSent updates from a background thread until stopped.
+    
+    Runs alongside the SMTP workers so Sheets round trips overlap with sends.
+    Updates are flushed in batches of UPDATE_FLUSH_SIZE, or after
+    UPDATE_FLUSH_INTERVAL seconds without a new one, with transient API
+    errors retried by flush_updates. If a write still fails, the error is
+    recorded in errors and the unsent jobs are discarded, so no more
+    reminders go out that couldn't be recorded. The writer then keeps
+    collecting updates (the main thread is never left blocked on it) and
+    makes one last attempt to write them all when stopped.
+    
+    Args:
+        worksheet (gspread.Worksheet): Worksheet to update
+        updates (queue.Queue): {'range': ..., 'values': [[...]]} dicts, then
+            None to flush what is left and stop
+        jobs (queue.Queue): The workers' job queue, emptied on a failed write
+        errors (list): Receives any exception raised while writing
+    """
+    pending_updates = []
+    done = False
+    while not done:
+        try:
+            update = updates.get(timeout=UPDATE_FLUSH_INTERVAL)
+            if update is None:
+                done = True
+            else:
+                pending_updates.append(update)
+                if errors or len(pending_updates) < UPDATE_FLUSH_SIZE:
+                    continue
+        except queue.Empty:
+            if errors:
+                continue  # Sheets is failing; wait for the end to retry
+        
+        try:
+            flush_updates(worksheet, pending_updates)
+        except Exception as e:
+            if not errors:
+                print("Error: Stopping early; no more reminders will be sent.")
+                drain_queue(jobs)
+            errors.append(e)
+
+
+def print_worksheet_titles(titles):
+    """Print the spreadsheet's worksheet names (helps diagnose tab-name typos)."""
+    print("Available worksheets in this spreadsheet:")
+    for title in titles:
+        print(f"  - '{title}'")
+    print()
+
+
+def is_non_responder(row, responder_names):
+    """
+    Check whether a master sheet row still needs a reminder.
+    
+    Args:
+        row (tuple): Master row fetched in MASTER_COLUMNS order
+        responder_names (frozenset): Stripped, casefolded responder names
         
     Returns:
-        str: Complete HTML reminder email body as a string
+        bool: True if Status is "Sent", the name has not responded and
+            ReminderSent is empty
     """
-    email_html = f"""
+    # Cheapest rejections first: early in a campaign most rows aren't "Sent"
+    # yet, so they are dropped before any name normalization happens
+    
+    # Check Status column (column E) - must be "Sent"
+    if row[STATUS_COLUMN].strip() != "Sent":
+        return False  # Skip if email wasn't sent yet
+    
+    # Check ReminderSent column (column G) - must be empty
+    if row[REMINDERSENT_COLUMN].strip():
+        return False  # Skip if reminder already sent
+    
+    # Extract name for comparison (normalized the same way as responder_names)
+    name_key = row[NAME_COLUMN].strip().casefold()
+    
+    # Skip empty names, and "Name" in case the header leaked through
+    if not name_key or name_key == 'name':
+        return False
+    
+    # Check if name is in responder_names set (case-insensitive comparison)
+    return name_key not in responder_names
+
+
+# Compiled once as a string.Template; literal dollar signs would be written as $$
+_REMINDER_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -58,7 +220,7 @@ def create_reminder_email_body(name, form_url, grant_deadline):
                     <tr>
                         <td style="padding: 30px 30px 20px 30px;">
                             <h1 style="margin: 0; color: #333333; font-size: 24px;">
-                                Hi {name},
+                                Hi ${name},
                             </h1>
                         </td>
                     </tr>
@@ -81,7 +243,7 @@ def create_reminder_email_body(name, form_url, grant_deadline):
                             <table role="presentation" cellpadding="0" cellspacing="0">
                                 <tr>
                                     <td align="center" style="background-color: #007bff; border-radius: 5px;">
-                                        <a href="{form_url}" 
+                                        <a href="${form_url}" 
                                            style="display: inline-block; padding: 14px 30px; color: #ffffff; 
                                                   text-decoration: none; font-size: 16px; font-weight: bold;
                                                   border-radius: 5px;">
@@ -97,7 +259,7 @@ def create_reminder_email_body(name, form_url, grant_deadline):
                     <tr>
                         <td style="padding: 0 30px 30px 30px;">
                             <p style="margin: 0; color: #d9534f; font-size: 14px; font-weight: bold; text-align: center;">
-                                Please respond by {grant_deadline}
+                                Please respond by ${grant_deadline}
                             </p>
                         </td>
                     </tr>
@@ -108,8 +270,50 @@ def create_reminder_email_body(name, form_url, grant_deadline):
     </table>
 </body>
 </html>
-"""
-    return email_html
+""")
+
+
+@functools.lru_cache(maxsize=16)
+def reminder_template(grant_deadline):
+    """
+    Pre-render the reminder template and split it around the per-recipient fields.
+    
+    The deadline is the same for every reminder, so it is filled in once and
+    the result is cut at ${name} and ${form_url}; each email is then a single
+    join of five strings.
+    
+    Args:
+        grant_deadline (str): Deadline date for the grant application
+        
+    Returns:
+        tuple: (prefix, middle, suffix) strings surrounding the name and form URL
+    """
+    rendered = _REMINDER_TEMPLATE.safe_substitute(grant_deadline=grant_deadline)
+    prefix, rest = rendered.split('${name}', 1)
+    middle, suffix = rest.split('${form_url}', 1)
+    return prefix, middle, suffix
+
+
+def create_reminder_email_body(name, form_url, grant_deadline):
+    """
+    Create shorter HTML reminder email body.
+    
+    Generates a concise reminder email template with:
+    - Personalized greeting
+    - Brief reminder message
+    - Call-to-action button linking to the form
+    - Deadline urgency message
+    
+    Args:
+        name (str): Recipient's name for personalization
+        form_url (str): Pre-filled Google Form URL for the call-to-action
+        grant_deadline (str): Deadline date for the grant application
+        
+    Returns:
+        str: Complete HTML reminder email body as a string
+    """
+    prefix, middle, suffix = reminder_template(grant_deadline)
+    return ''.join((prefix, name, middle, form_url, suffix))
 
 
 def main():
@@ -141,7 +345,28 @@ def main():
         action='store_true',
         help='Run in dry-run mode (no emails sent, no sheet updates)'
     )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Print extra diagnostics, such as the worksheets in the spreadsheet'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=5,
+        help='Number of parallel SMTP connections (default: 5)'
+    )
     args = parser.parse_args()
+    
+    # Deferred imports: the Google client stack, dotenv and the email package
+    # are slow to load and aren't needed for --help or argument errors
+    from email.message import EmailMessage
+    from email.utils import make_msgid
+    
+    import gspread
+    from dotenv import load_dotenv
+    from gspread.utils import absolute_range_name
+    from oauth2client.service_account import ServiceAccountCredentials
     batch_size = args.size
     
     print("="*60)
@@ -203,114 +428,91 @@ def main():
         print(f"Opening Google Sheet (ID: {config['sheet_id']})...")
         sheet = client.open_by_key(config['sheet_id'])
         
-        # Debug output: List all available worksheets
-        print("Available worksheets in this spreadsheet:")
-        for worksheet in sheet.worksheets():
-            print(f"  - '{worksheet.title}'")
-        print()
+        # One metadata request returns every tab; both tabs are looked up from it
+        worksheets_by_title = {worksheet.title: worksheet for worksheet in sheet.worksheets()}
+        
+        if args.verbose:
+            print_worksheet_titles(worksheets_by_title)
         
         # Access the master sheet tab
         print(f"Accessing master worksheet: {config['master_sheet_tab']}...")
-        master_worksheet = sheet.worksheet(config['master_sheet_tab'])
+        master_worksheet = worksheets_by_title.get(config['master_sheet_tab'])
+        if master_worksheet is None:
+            print_worksheet_titles(worksheets_by_title)
+            raise gspread.exceptions.WorksheetNotFound(config['master_sheet_tab'])
         
         # Access the responses sheet tab
         print(f"Accessing responses worksheet: {config['responses_sheet_tab']}...")
-        try:
-            responses_worksheet = sheet.worksheet(config['responses_sheet_tab'])
-        except gspread.exceptions.WorksheetNotFound:
+        responses_worksheet = worksheets_by_title.get(config['responses_sheet_tab'])
+        if responses_worksheet is None:
             print(f"Warning: Responses worksheet '{config['responses_sheet_tab']}' not found.")
             print("Assuming no responses yet - all people with Status='Sent' are non-responders.")
-            responses_worksheet = None
+            print_worksheet_titles(worksheets_by_title)
         
-        # Column indices based on Master Sheet structure
-        NAME_COLUMN = 0      # Column A
-        EMAIL_COLUMN = 1     # Column B
-        STATUS_COLUMN = 4    # Column E
-        REMINDERSENT_COLUMN = 6  # Column G
+        # Fetch the master columns and the responses Name column (column B;
+        # column A is the Timestamp) in a single batchGet request. Data starts
+        # at row 2, below the header row
+        print("Reading data from master and responses sheets...")
+        ranges = [
+            absolute_range_name(master_worksheet.title, f'{column}2:{column}')
+            for column in MASTER_COLUMNS
+        ]
+        if responses_worksheet:
+            ranges.append(absolute_range_name(responses_worksheet.title, 'B2:B'))
         
-        # Read all rows from master sheet
-        print("Reading data from master sheet...")
-        master_all_rows = master_worksheet.get_all_values()
+        value_ranges = sheet.values_batch_get(
+            ranges,
+            params={'majorDimension': 'COLUMNS'}
+        )['valueRanges']
         
-        if len(master_all_rows) < 2:
+        # Each range comes back as one column, or no 'values' at all when empty
+        columns = [
+            value_range['values'][0] if value_range.get('values') else []
+            for value_range in value_ranges
+        ]
+        
+        # Columns are trimmed after their last non-empty cell; zip_longest pads
+        # them so every row has all four fields
+        master_data_rows = list(zip_longest(*columns[:len(MASTER_COLUMNS)], fillvalue=''))
+        
+        if not master_data_rows:
             print("Warning: Master sheet appears to be empty or only contains headers.")
             return
         
-        # Read all rows from responses sheet (if it exists)
-        responder_names = set()
+        # Collect responder names (if the responses sheet exists)
+        responder_names = frozenset()
         if responses_worksheet:
-            print("Reading data from responses sheet...")
-            responses_all_rows = responses_worksheet.get_all_values()
-            
-            # Skip header row (index 0), extract names from responses sheet
-            # Column 0 is Timestamp, Column 1 is Name field
-            if len(responses_all_rows) > 1:
-                for row in responses_all_rows[1:]:  # Skip header
-                    if len(row) > 1 and row[1]:  # Check column 1 (Name field)
-                        # Normalize name for comparison (strip and lowercase)
-                        # Column 1 is the Name field (Column 0 is Timestamp)
-                        name = str(row[1]).strip()
-                        if name and name.lower() != 'name':  # Skip header if it leaked through
-                            responder_names.add(name.lower())
+            # Normalize names for comparison (strip and casefold), dropping
+            # blanks, and "name" in case the header leaked through
+            responder_names = frozenset(
+                name.strip().casefold() for name in columns[len(MASTER_COLUMNS)]
+            ) - {'', 'name'}
             
             print(f"Found {len(responder_names)} unique responders in responses sheet.")
         else:
             print("No responses sheet found - all people with Status='Sent' are non-responders.")
         
-        # Skip header row (index 0), process data rows only
-        # all_rows[0] is the header, all_rows[1:] are data rows
-        master_data_rows = master_all_rows[1:]
-        
         # Identify non-responders
         # Logic: Status="Sent" AND Name NOT in responder_names AND ReminderSent is empty
         print()
         print("Checking for non-responders...")
-        non_responders = []
-        
-        for i, row in enumerate(master_data_rows):
-            # Calculate actual row index in sheet (i+2 because row 1 is header, row 2 is first data row)
-            row_index = i + 2
-            
-            # Safety check: Skip if Name column contains "Name" (in case header leaked through)
-            if len(row) > 0 and str(row[0]).strip().lower() == 'name':
-                continue
-            
-            # Extract name for comparison
-            if len(row) <= NAME_COLUMN:
-                continue
-            
-            name = str(row[NAME_COLUMN]).strip() if row[NAME_COLUMN] else ""
-            if not name:
-                continue
-            
-            # Check Status column (index 4, column E) - must be "Sent"
-            if len(row) > STATUS_COLUMN:
-                status = str(row[STATUS_COLUMN]).strip() if row[STATUS_COLUMN] else ""
-            else:
-                status = ""
-            
-            if status != "Sent":
-                continue  # Skip if email wasn't sent yet
-            
-            # Check if name is in responder_names set (case-insensitive comparison)
-            # Normalize name the same way as when building responder_names (name is already stripped, just lowercase)
-            name_lower = name.lower()
-            if name_lower in responder_names:
-                continue  # Skip if they already responded
-            
-            # Check ReminderSent column (index 6, column G) - must be empty
-            if len(row) > REMINDERSENT_COLUMN:
-                reminder_sent = str(row[REMINDERSENT_COLUMN]).strip() if row[REMINDERSENT_COLUMN] else ""
-            else:
-                reminder_sent = ""
-            
-            if reminder_sent:
-                continue  # Skip if reminder already sent
-            
-            # All conditions met - this is a non-responder who needs a reminder
-            non_responders.append((row_index, row))
+        # Row index in the sheet is i+2: row 1 is the header, row 2 the first data row
+        # With --size, stop scanning once one more than the batch has been found;
+        # that extra row is only used to report that more are waiting
+        scan_limit = batch_size + 1 if batch_size else None
+        non_responders = list(islice(
+            (
+                (i + 2, row)
+                for i, row in enumerate(master_data_rows)
+                if is_non_responder(row, responder_names)
+            ),
+            scan_limit
+        ))
         
-        print(f"Found {len(non_responders)} people who haven't responded.")
+        if batch_size and len(non_responders) > batch_size:
+            print(f"Found at least {len(non_responders)} people who haven't responded.")
+        else:
+            print(f"Found {len(non_responders)} people who haven't responded.")
         print()
         
         if not non_responders:
@@ -343,46 +545,47 @@ def main():
         # Get today's date for ReminderSent column
         today_date = date.today().strftime('%Y-%m-%d')
         
-        # Process each non-responder
-        print("="*60)
-        print("Sending Reminders:")
-        print("="*60)
+        # Connect to Gmail up front so a bad App Password stops the run before
+        # anything is sent; this session goes to the first worker
+        first_server = None
+        if not args.dry_run:
+            print("Connecting to Gmail SMTP server...")
+            first_server = open_smtp_ssl_connection(config['sender_email'], gmail_app_password)
+        
+        # Validate rows and build messages; sending happens afterwards in parallel
+        outgoing = []  # List of (row_index, name, email_address, msg)
+        
+        # Headers shared by every reminder in this run
+        from_header = f"{config['sender_name']} <{config['sender_email']}>"
+        subject = f"Reminder: Grant Support Needed by {config['grant_deadline']}"
+        
+        # Message-IDs use the sender's domain, worked out once here; without
+        # a domain make_msgid looks up this machine's FQDN for every message
+        msgid_domain = config['sender_email'].rpartition('@')[2]
         
         for row_index, row in rows_to_process:
             try:
-                # Extract name and email from row
-                if len(row) <= NAME_COLUMN:
-                    print(f"Row {row_index}: Missing name column, skipping...")
-                    failed_count += 1
-                    continue
-                
-                name = str(row[NAME_COLUMN]).strip() if row[NAME_COLUMN] else ""
+                # Extract name and email from row (gspread values are already str)
+                name = row[NAME_COLUMN].strip()
                 
                 if not name:
                     print(f"Row {row_index}: Empty name field, skipping...")
                     failed_count += 1
                     continue
                 
-                if len(row) <= EMAIL_COLUMN:
-                    print(f"Row {row_index} ({name}): Missing email column, skipping...")
-                    failed_count += 1
-                    continue
-                
-                email_address = str(row[EMAIL_COLUMN]).strip() if len(row) > EMAIL_COLUMN else ""
+                email_address = row[EMAIL_COLUMN].strip()
                 
                 if not email_address:
                     print(f"Row {row_index} ({name}): Empty email field, skipping...")
                     failed_count += 1
                     continue
                 
-                # Validate email format (basic check)
-                if '@' not in email_address:
+                # Validate email format
+                if not EMAIL_PATTERN.match(email_address):
                     print(f"Row {row_index} ({name}): Invalid email format ({email_address}), skipping...")
                     failed_count += 1
                     continue
                 
-                print(f"Sending reminder to: {name} ({email_address})...", end=' ', flush=True)
-                
                 # Generate personalized form URL
                 form_url = generate_form_url(
                     name,
@@ -397,60 +600,105 @@ def main():
                     config['grant_deadline']
                 )
                 
-                # Create email message
-                msg = MIMEMultipart('alternative')
-                msg['From'] = f"{config['sender_name']} <{config['sender_email']}>"
+                # Create email message; the body is HTML only, so it goes in a
+                # single text/html part rather than a multipart wrapper
+                msg = EmailMessage()
+                msg['From'] = from_header
                 msg['To'] = email_address
-                msg['Subject'] = f"Reminder: Grant Support Needed by {config['grant_deadline']}"
+                msg['Subject'] = subject
+                msg['Message-ID'] = make_msgid(domain=msgid_domain)
+                msg.set_content(reminder_email_html, subtype='html')
                 
-                # Attach HTML body
-                html_part = MIMEText(reminder_email_html, 'html')
-                msg.attach(html_part)
+                outgoing.append((row_index, name, email_address, msg))
+            
+            except Exception as e:
+                # Handle any unexpected errors in processing a row
+                print(f"Row {row_index}: Error processing row - {str(e)}")
+                failed_count += 1
+                continue
+        
+        # Send the prepared reminders
+        print("="*60)
+        print("Sending Reminders:")
+        print("="*60)
+        
+        if args.dry_run:
+            for row_index, name, email_address, msg in outgoing:
+                print(f"Sending reminder to: {name} ({email_address})...   [DRY RUN] Would send email (skipped)")
+                # Simulate success for dry run
+                sent_count += 1
+        elif not outgoing:
+            close_smtp_connection(first_server)
+        else:
+            jobs = queue.Queue()
+            for job in outgoing:
+                jobs.put(job)
+            results = queue.Queue()
+            
+            # ReminderSent writes go to a background writer that batches them
+            # into batch_update calls while the workers keep sending
+            updates = queue.Queue(maxsize=UPDATE_QUEUE_SIZE)
+            writer_errors = []
+            writer = threading.Thread(
+                target=sheet_writer,
+                args=(master_worksheet, updates, jobs, writer_errors)
+            )
+            writer.start()
+            
+            # Each worker owns one persistent SMTP session and pulls reminders
+            # off the shared queue until it is empty
+            workers = max(1, min(args.concurrency, len(outgoing)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for worker in range(workers):
+                    executor.submit(
+                        reminder_worker,
+                        jobs,
+                        results,
+                        config['sender_email'],
+                        gmail_app_password,
+                        first_server if worker == 0 else None
+                    )
                 
-                # Send email via Gmail SMTP
                 try:
-                    if args.dry_run:
-                        print("  [DRY RUN] Would send email (skipped)")
-                        # Simulate success for dry run
-                        sent_count += 1
-                    else:
-                        # Connect to Gmail SMTP server
-                        server = smtplib.SMTP('smtp.gmail.com', 587)
-                        server.starttls()  # Enable TLS encryption
-                        server.login(config['sender_email'], gmail_app_password)
-                        server.send_message(msg)
-                        server.quit()
+                    # Read results until every worker has stopped; the writer
+                    # may have cut the queue short after a failed sheet write
+                    running = workers
+                    while running:
+                        result = results.get()
+                        if result is None:
+                            running -= 1
+                            continue
+                        row_index, name, email_address, error_msg = result
+                        if error_msg:
+                            print(f"Sending reminder to: {name} ({email_address})... ✗ Failed: {error_msg}")
+                            failed_count += 1
+                            # Don't update ReminderSent on failure
+                            continue
                         
-                        # Update Google Sheet: Mark ReminderSent with today's date
-                        remindersent_cell = f'G{row_index}'
-                        master_worksheet.update_acell(remindersent_cell, today_date)
+                        # Queue Google Sheet update: Mark ReminderSent with today's date
+                        updates.put({'range': f'G{row_index}', 'values': [[today_date]]})
                         
-                        print("✓ Sent")
+                        print(f"Sending reminder to: {name} ({email_address})... ✓ Sent")
                         sent_count += 1
+                finally:
+                    # If we're bailing out early, stop workers from picking up more
+                    drain_queue(jobs)
                     
-                except smtplib.SMTPAuthenticationError as e:
-                    error_msg = f"SMTP Authentication failed: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    # Don't update ReminderSent on failure
-                    
-                except smtplib.SMTPException as e:
-                    error_msg = f"SMTP error: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    # Don't update ReminderSent on failure
-                    
-                except Exception as e:
-                    error_msg = f"Unexpected error: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    # Don't update ReminderSent on failure
+                    # Wait for sends already under way and record the ones that
+                    # went out, even if the run was interrupted
+                    executor.shutdown()
+                    while True:
+                        try:
+                            result = results.get_nowait()
+                        except queue.Empty:
+                            break
+                        if result is not None and not result[3]:
+                            updates.put({'range': f'G{result[0]}', 'values': [[today_date]]})
+                    updates.put(None)
+                    writer.join()
             
-            except Exception as e:
-                # Handle any unexpected errors in processing a row
-                print(f"Row {row_index}: Error processing row - {str(e)}")
-                failed_count += 1
-                continue
+            if writer_errors:
+                raise writer_errors[0]
         
         # Print final summary
         print()
@@ -468,6 +716,10 @@ def main():
         print(f"Error: Google Sheets API error: {e}")
     except gspread.exceptions.SpreadsheetNotFound:
         print(f"Error: Google Sheet not found. Please check the sheet_id in config.json.")
+    except smtplib.SMTPAuthenticationError as e:
+        print(f"Error: SMTP Authentication failed: {e}")
+    except smtplib.SMTPException as e:
+        print(f"Error: Could not connect to Gmail SMTP server: {e}")
     except Exception as e:
         print(f"Unexpected error: {type(e).__name__}: {e}")
 
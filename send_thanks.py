@@ -8,55 +8,65 @@ based on their response (Yes/No/Other).
 
 import argparse
 import os
+import queue
+import re
 import smtplib
+import string
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
+from itertools import zip_longest
 
 import gspread
+from gspread.utils import absolute_range_name
 from dotenv import load_dotenv
 from oauth2client.service_account import ServiceAccountCredentials
 
-from email_generator import load_config
+from email_generator import EMAIL_PATTERN, load_config
+from retry_utils import call_with_retry, flush_updates
+from smtp_utils import close_smtp_connection, open_smtp_connection
 
+# First whole-word Yes/No in a form response (see classify_response)
+RESPONSE_PATTERN = re.compile(r'\b(yes|no)\b', re.IGNORECASE)
 
-def create_thank_you_email_body(name, response):
-    """
-    Create personalized HTML thank you email body based on response type.
-    
-    Generates a thank you email template with:
-    - Personalized greeting
-    - Thank you message based on response (Yes/No/Other)
-    - Brief closing message
-    
-    Args:
-        name (str): Recipient's name for personalization
-        response (str): Their response (Yes/No/Other)
-        
-    Returns:
-        str: Complete HTML thank you email body as a string
-    """
-    # Determine thank you message based on response
-    response_lower = str(response).strip().lower() if response else ""
-    
-    if "yes" in response_lower:
-        thank_you_message = (
-            "Thank you so much for your support! Your positive response means a great deal "
-            "to our grant initiative. We truly appreciate you taking the time to respond."
-        )
-    elif "no" in response_lower:
-        thank_you_message = (
-            "Thank you for taking the time to respond. We appreciate your time and consideration, "
-            "and we understand that not everyone can participate. Your feedback is valuable to us."
-        )
-    else:
-        # For "Other" or any other response
-        thank_you_message = (
-            "Thank you for your response! We appreciate you taking the time to provide feedback. "
-            "Your input helps us understand the community's perspective on this initiative."
-        )
-    
-    email_html = f"""
+# Reconnect after this many messages so one session stays within Gmail's
+# per-connection limits
+SMTP_MESSAGES_PER_CONNECTION = 100
+
+# Gmail's sending rate ceiling: at most this many messages per second across
+# all workers, with up to SEND_BURST sent back to back after an idle spell
+SEND_RATE_PER_SECOND = 14
+SEND_BURST = 14
+
+# Queued ThankYouSent writes are flushed in one batch_update once this many accumulate
+UPDATE_FLUSH_SIZE = 100
+
+# Thank you message and subject line for each kind of response (see classify_response)
+THANK_YOU_MESSAGES = {
+    'yes': (
+        "Thank you so much for your support! Your positive response means a great deal "
+        "to our grant initiative. We truly appreciate you taking the time to respond."
+    ),
+    'no': (
+        "Thank you for taking the time to respond. We appreciate your time and consideration, "
+        "and we understand that not everyone can participate. Your feedback is valuable to us."
+    ),
+    'other': (
+        "Thank you for your response! We appreciate you taking the time to provide feedback. "
+        "Your input helps us understand the community's perspective on this initiative."
+    ),
+}
+EMAIL_SUBJECTS = {
+    'yes': "Thank You for Your Support",
+    'no': "Thank You for Your Feedback",
+    'other': "Thank You for Your Feedback",
+}
+
+# Compiled once as a string.Template; literal dollar signs would be written as $$
+_THANK_YOU_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -77,7 +87,7 @@ def create_thank_you_email_body(name, response):
                     <tr>
                         <td style="padding: 30px 30px 20px 30px;">
                             <h1 style="margin: 0; color: #333333; font-size: 24px;">
-                                Hi {name},
+                                Hi ${name},
                             </h1>
                         </td>
                     </tr>
@@ -87,7 +97,7 @@ def create_thank_you_email_body(name, response):
                         <td style="padding: 0 30px 20px 30px;">
                             <!-- Thank you message -->
                             <p style="margin: 0 0 20px 0; color: #555555; font-size: 16px; line-height: 1.6;">
-                                {thank_you_message}
+                                ${thank_you_message}
                             </p>
                             
                             <p style="margin: 0; color: #555555; font-size: 16px; line-height: 1.6;">
@@ -101,7 +111,7 @@ def create_thank_you_email_body(name, response):
                         <td style="padding: 20px 30px 30px 30px;">
                             <p style="margin: 0; color: #555555; font-size: 16px; line-height: 1.6;">
                                 Best regards,<br>
-                                {name.split()[0] if ' ' in name else name}  <!-- Use first name if available -->
+                                ${first_name}  <!-- Use first name if available -->
                             </p>
                         </td>
                     </tr>
@@ -112,27 +122,167 @@ def create_thank_you_email_body(name, response):
     </table>
 </body>
 </html>
-"""
-    return email_html
+""")
+
+# The message only depends on the response kind, so it is filled in once per
+# kind at import; rendering a body then only substitutes the recipient's names.
+# Dollar signs in a message are escaped so they stay literal
+_THANK_YOU_TEMPLATES = {
+    kind: string.Template(
+        _THANK_YOU_TEMPLATE.template.replace('${thank_you_message}', message.replace('$', '$$'))
+    )
+    for kind, message in THANK_YOU_MESSAGES.items()
+}
+
+
+def classify_response(response):
+    """
+    Classify a form response as 'yes', 'no' or 'other'.
+    
+    Done once per responder so the body and subject don't each re-normalize
+    the response text. The first whole-word "yes" or "no" decides, so words
+    like "yesterday" or "nothing" don't count as an answer.
+    
+    Args:
+        response (str): Their response (Yes/No/Other), possibly empty
+        
+    Returns:
+        str: 'yes', 'no' or 'other'
+    """
+    match = RESPONSE_PATTERN.search(response) if response else None
+    
+    # For "Other" or any other response
+    if match is None:
+        return 'other'
+    return match.group(1).lower()
+
+
+def create_thank_you_email_body(name, kind):
+    """
+    Create personalized HTML thank you email body based on response type.
+    
+    Generates a thank you email template with:
+    - Personalized greeting
+    - Thank you message based on response (Yes/No/Other)
+    - Brief closing message
+    
+    Args:
+        name (str): Recipient's name (already stripped) for personalization
+        kind (str): Response kind from classify_response ('yes', 'no' or 'other')
+        
+    Returns:
+        str: Complete HTML thank you email body as a string
+    """
+    return _THANK_YOU_TEMPLATES[kind].substitute(
+        name=name,
+        first_name=name.partition(' ')[0] or name  # Use first name if available
+    )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces sends to a steady rate.
+    
+    Tokens refill continuously at `rate` per second up to `burst`. Each
+    acquire() takes one token; when none are left the caller reserves the
+    next one and sleeps until it is due, outside the lock, so waiting
+    workers queue up in order instead of spinning.
+    """
+    
+    def __init__(self, rate, burst):
+        """
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Most tokens that can be saved up
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available if necessary."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+def thank_you_worker(jobs, results, sender_email, password, bucket, server=None):
+    """
+    Send queued thank yous on one persistent SMTP session until the queue is empty.
+    
+    Transient errors (4xx replies, dropped sessions) are retried with
+    call_with_retry, reopening the session as needed, and the session is
+    recycled every SMTP_MESSAGES_PER_CONNECTION messages.
+    
+    Args:
+        jobs (queue.Queue): (row_index, name, email_address, msg) tuples to send
+        results (queue.Queue): Receives (row_index, name, email_address, error_message)
+            per job, with an empty error_message on success
+        sender_email (str): Gmail address to log in as
+        password (str): Gmail App Password
+        bucket (TokenBucket): Rate limiter shared by all workers; one token per send
+        server (smtplib.SMTP): Already-open session to start with (optional)
+    """
+    messages_on_connection = 0
+    
+    def send(msg):
+        nonlocal server, messages_on_connection
+        # Recycle the session once it has carried its share of messages
+        if server is not None and messages_on_connection >= SMTP_MESSAGES_PER_CONNECTION:
+            close_smtp_connection(server)
+            server = None
+        if server is None:
+            server = open_smtp_connection(sender_email, password)
+            messages_on_connection = 0
+        bucket.acquire()
+        try:
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            server = None  # Reconnect on the next attempt
+            raise
+        messages_on_connection += 1
+    
+    try:
+        while True:
+            try:
+                row_index, name, email_address, msg = jobs.get_nowait()
+            except queue.Empty:
+                return
+            
+            error_msg = ""
+            try:
+                call_with_retry(send, msg)
+            except smtplib.SMTPAuthenticationError as e:
+                error_msg = f"SMTP Authentication failed: {str(e)}"
+            except smtplib.SMTPException as e:
+                error_msg = f"SMTP error: {str(e)}"
+            except Exception as e:
+                error_msg = f"Unexpected error: {str(e)}"
+            
+            results.put((row_index, name, email_address, error_msg))
+    finally:
+        if server is not None:
+            close_smtp_connection(server)
 
 
-def get_email_subject(response):
+def get_email_subject(kind):
     """
     Get email subject line based on response type.
     
     Args:
-        response (str): The response (Yes/No/Other)
+        kind (str): Response kind from classify_response ('yes', 'no' or 'other')
         
     Returns:
         str: Subject line for the email
     """
-    response_lower = str(response).strip().lower() if response else ""
-    
-    if "yes" in response_lower:
-        return "Thank You for Your Support"
-    else:
-        # For "No", "Other", or any other response
-        return "Thank You for Your Feedback"
+    return EMAIL_SUBJECTS[kind]
 
 
 def main():
@@ -165,6 +315,12 @@ def main():
         action='store_true',
         help='Run in dry-run mode (no emails sent, no sheet updates)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=5,
+        help='Number of parallel SMTP connections (default: 5)'
+    )
     args = parser.parse_args()
     batch_size = args.size
     
@@ -239,76 +395,88 @@ def main():
             print(f"Error: Responses worksheet '{config['responses_sheet_tab']}' not found.")
             return
         
-        # Column indices based on Master Sheet structure
+        # Columns we read, in the order they are fetched; nothing else is downloaded
+        MASTER_COLUMNS = ['A', 'B', 'H']     # Name, Email, ThankYouSent
+        RESPONSE_COLUMNS = ['B', 'C']        # Name field, Response (A is the Timestamp)
+        
+        # Indices into each fetched master row, following MASTER_COLUMNS
         NAME_COLUMN = 0      # Column A
         EMAIL_COLUMN = 1     # Column B
-        THANKYOUSENT_COLUMN = 7  # Column H
+        THANKYOUSENT_COLUMN = 2  # Column H
+        
+        # Fetch the master and responses columns in a single batchGet request.
+        # Data starts at row 2, below each sheet's header row
+        print("Reading data from master and responses sheets...")
+        ranges = [
+            absolute_range_name(master_worksheet.title, f'{column}2:{column}')
+            for column in MASTER_COLUMNS
+        ] + [
+            absolute_range_name(responses_worksheet.title, f'{column}2:{column}')
+            for column in RESPONSE_COLUMNS
+        ]
         
-        # Column indices for Responses Sheet
-        RESPONSE_TIMESTAMP_COLUMN = 0  # Column 0
-        RESPONSE_NAME_COLUMN = 1       # Column 1
-        RESPONSE_VALUE_COLUMN = 2      # Column 2
-        RESPONSE_TEXT_COLUMN = 3       # Column 3
+        value_ranges = sheet.values_batch_get(
+            ranges,
+            params={'majorDimension': 'COLUMNS'}
+        )['valueRanges']
         
-        # Read all rows from master sheet
-        print("Reading data from master sheet...")
-        master_all_rows = master_worksheet.get_all_values()
+        # Each range comes back as one column, or no 'values' at all when empty
+        columns = [
+            value_range['values'][0] if value_range.get('values') else []
+            for value_range in value_ranges
+        ]
+        del value_ranges
+        master_columns = columns[:len(MASTER_COLUMNS)]
+        response_columns = columns[len(MASTER_COLUMNS):]
         
-        if len(master_all_rows) < 2:
+        if not any(master_columns):
             print("Warning: Master sheet appears to be empty or only contains headers.")
             return
         
-        # Read all rows from responses sheet
-        print("Reading data from responses sheet...")
-        responses_all_rows = responses_worksheet.get_all_values()
-        
-        if len(responses_all_rows) < 2:
+        if not any(response_columns):
             print("Warning: Responses sheet appears to be empty or only contains headers.")
             return
         
-        # Build a mapping from master sheet: name (lowercase) -> (row_index, email, thankyou_sent)
-        # Skip header row (index 0)
-        master_name_map = {}
-        master_data_rows = master_all_rows[1:]
+        # Columns are trimmed after their last non-empty cell; zip_longest pads
+        # them back into fixed-width rows. Both are consumed once, so rows are
+        # streamed instead of copied into lists
+        master_data_rows = zip_longest(*master_columns, fillvalue='')
+        response_rows = zip_longest(*response_columns, fillvalue='')
         
-        for i, row in enumerate(master_data_rows):
-            row_index = i + 2  # Row 1 is header, row 2 is first data row
-            
-            # Safety check: Skip if Name column contains "Name"
-            if len(row) > 0 and str(row[0]).strip().lower() == 'name':
-                continue
-            
-            if len(row) > NAME_COLUMN:
-                name = str(row[NAME_COLUMN]).strip() if row[NAME_COLUMN] else ""
-                if name:
-                    name_lower = name.lower()
-                    email = str(row[EMAIL_COLUMN]).strip() if len(row) > EMAIL_COLUMN and row[EMAIL_COLUMN] else ""
-                    thankyou_sent = str(row[THANKYOUSENT_COLUMN]).strip() if len(row) > THANKYOUSENT_COLUMN and row[THANKYOUSENT_COLUMN] else ""
-                    master_name_map[name_lower] = (row_index, email, thankyou_sent)
+        # Build a mapping from master sheet: name (lowercase) -> (row_index, email, thankyou_sent)
+        # Row index is i+2: row 1 is header, row 2 is first data row. Blank names
+        # and "Name" (in case the header leaked through) are skipped
+        master_name_map = {
+            row[NAME_COLUMN].strip().lower(): (
+                i + 2,
+                row[EMAIL_COLUMN].strip(),
+                row[THANKYOUSENT_COLUMN].strip()
+            )
+            for i, row in enumerate(master_data_rows)
+            if row[NAME_COLUMN].strip() and row[NAME_COLUMN].strip().lower() != 'name'
+        }
         
         print(f"Found {len(master_name_map)} people in master sheet.")
         
-        # Extract responder data from responses sheet
-        # Skip header row (index 0)
+        # Join responses to the master sheet in one pass: one dict lookup per
+        # response. Blank names and "Name" never match, since the master map
+        # skips them too
         responders_needing_thanks = []
         
-        for row in responses_all_rows[1:]:  # Skip header
-            if len(row) > RESPONSE_NAME_COLUMN and row[RESPONSE_NAME_COLUMN]:
-                # Extract name and normalize for matching
-                name = str(row[RESPONSE_NAME_COLUMN]).strip()
-                if name and name.lower() != 'name':  # Skip header if it leaked through
-                    name_lower = name.lower()
-                    
-                    # Get response value
-                    response = str(row[RESPONSE_VALUE_COLUMN]).strip() if len(row) > RESPONSE_VALUE_COLUMN and row[RESPONSE_VALUE_COLUMN] else ""
-                    
-                    # Try to match to master sheet
-                    if name_lower in master_name_map:
-                        row_index, email, thankyou_sent = master_name_map[name_lower]
-                        
-                        # Check if thank you hasn't been sent yet
-                        if not thankyou_sent:
-                            responders_needing_thanks.append((row_index, email, name, response))
+        for name, response in response_rows:  # Rows follow RESPONSE_COLUMNS order
+            name = name.strip()
+            match = master_name_map.get(name.lower())
+            if match is None:
+                continue  # Not in the master sheet
+            
+            # Check if thank you hasn't been sent yet
+            row_index, email, thankyou_sent = match
+            if not thankyou_sent:
+                responders_needing_thanks.append((row_index, email, name, response.strip()))
+        
+        # Only responders_needing_thanks is used from here on; free the sheet
+        # data before the (long) send phase
+        del columns, master_columns, response_columns, master_name_map
         
         print(f"Found {len(responders_needing_thanks)} people who responded and need thank yous.")
         print()
@@ -343,80 +511,66 @@ def main():
         # Get today's date for ThankYouSent column
         today_date = date.today().strftime('%Y-%m-%d')
         
-        # Process each responder
-        print("="*60)
-        print("Sending Thank You Emails:")
-        print("="*60)
+        # ThankYouSent writes are queued here and sent with batch_update,
+        # instead of one update_acell API call per thank you
+        pending_updates = []
+        
+        # Drop rows with a missing or malformed email address before any
+        # connection is opened, so only sendable rows reach the send path.
+        # EMAIL_PATTERN is the one shared with send_batch, so every address
+        # that got the campaign email passes here too
+        valid_people = []
+        notes = []  # Per-row validation messages, written after the loop
+        note = notes.append
+        for person in people_to_process:
+            row_index, email_address, name, response = person
+            if not email_address:
+                note(f"Row {row_index} ({name}): Empty email field, skipping...")
+                failed_count += 1
+            elif not EMAIL_PATTERN.match(email_address):
+                note(f"Row {row_index} ({name}): Invalid email format ({email_address}), skipping...")
+                failed_count += 1
+            else:
+                valid_people.append(person)
+        
+        # Validation messages are collected and written in one go; there's no
+        # network wait in this loop for per-line output to report on
+        if notes:
+            sys.stdout.write("\n".join(notes) + "\n")
         
-        for row_index, email_address, name, response in people_to_process:
+        # Connect to Gmail up front so a bad App Password stops the run before
+        # anything is sent; this session goes to the first worker
+        first_server = None
+        if not args.dry_run and valid_people:
+            print("Connecting to Gmail SMTP server...")
+            first_server = open_smtp_connection(config['sender_email'], gmail_app_password)
+        
+        # Build messages; sending happens afterwards in parallel
+        outgoing = []  # List of (row_index, name, email_address, msg)
+        
+        # From header shared by every thank you in this run
+        from_header = f"{config['sender_name']} <{config['sender_email']}>"
+        
+        for row_index, email_address, name, response in valid_people:
             try:
-                if not email_address:
-                    print(f"Row {row_index} ({name}): Empty email field, skipping...")
-                    failed_count += 1
-                    continue
-                
-                # Validate email format (basic check)
-                if '@' not in email_address:
-                    print(f"Row {row_index} ({name}): Invalid email format ({email_address}), skipping...")
-                    failed_count += 1
-                    continue
-                
-                print(f"Sending thank you to: {name} ({email_address})...", end=' ', flush=True)
+                # Classify the response once; body and subject both key off it
+                kind = classify_response(response)
                 
                 # Create thank you email body HTML
-                thank_you_email_html = create_thank_you_email_body(name, response)
+                thank_you_email_html = create_thank_you_email_body(name, kind)
                 
                 # Get subject line based on response
-                subject = get_email_subject(response)
+                subject = get_email_subject(kind)
                 
-                # Create email message
-                msg = MIMEMultipart('alternative')
-                msg['From'] = f"{config['sender_name']} <{config['sender_email']}>"
+                # Create email message; the body is HTML only, so it goes in a
+                # single text/html part rather than a multipart wrapper
+                msg = EmailMessage()
+                msg['From'] = from_header
                 msg['To'] = email_address
                 msg['Subject'] = subject
+                msg.set_content(thank_you_email_html, subtype='html')
                 
-                # Attach HTML body
-                html_part = MIMEText(thank_you_email_html, 'html')
-                msg.attach(html_part)
-                
-                # Send email via Gmail SMTP
-                try:
-                    if args.dry_run:
-                        print("  [DRY RUN] Would send email (skipped)")
-                        # Simulate success for dry run
-                        sent_count += 1
-                    else:
-                        # Connect to Gmail SMTP server
-                        server = smtplib.SMTP('smtp.gmail.com', 587)
-                        server.starttls()  # Enable TLS encryption
-                        server.login(config['sender_email'], gmail_app_password)
-                        server.send_message(msg)
-                        server.quit()
-                        
-                        # Update Google Sheet: Mark ThankYouSent with today's date
-                        thankyousent_cell = f'H{row_index}'
-                        master_worksheet.update_acell(thankyousent_cell, today_date)
-                        
-                        print("✓ Sent")
-                        sent_count += 1
-                    
-                except smtplib.SMTPAuthenticationError as e:
-                    error_msg = f"SMTP Authentication failed: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    # Don't update ThankYouSent on failure
-                    
-                except smtplib.SMTPException as e:
-                    error_msg = f"SMTP error: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    # Don't update ThankYouSent on failure
-                    
-                except Exception as e:
-                    error_msg = f"Unexpected error: {str(e)}"
-                    print(f"✗ Failed: {error_msg}")
-                    failed_count += 1
-                    # Don't update ThankYouSent on failure
+                outgoing.append((row_index, name, email_address, msg))
             
             except Exception as e:
                 # Handle any unexpected errors in processing
@@ -424,6 +578,83 @@ def main():
                 failed_count += 1
                 continue
         
+        # Send the prepared thank yous
+        print("="*60)
+        print("Sending Thank You Emails:")
+        print("="*60)
+        
+        if args.dry_run:
+            # Simulate success for dry run; nothing is sent, so write all lines at once
+            sys.stdout.write("".join(
+                f"Sending thank you to: {name} ({email_address})...   [DRY RUN] Would send email (skipped)\n"
+                for row_index, name, email_address, msg in outgoing
+            ))
+            sent_count += len(outgoing)
+        elif not outgoing:
+            if first_server is not None:
+                close_smtp_connection(first_server)
+        else:
+            jobs = queue.Queue()
+            for job in outgoing:
+                jobs.put(job)
+            results = queue.Queue()
+            
+            # Each worker owns one persistent SMTP session and pulls thank yous
+            # off the shared queue until it is empty; together they stay under
+            # Gmail's send rate
+            bucket = TokenBucket(SEND_RATE_PER_SECOND, SEND_BURST)
+            workers = max(1, min(args.concurrency, len(outgoing)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for worker in range(workers):
+                    executor.submit(
+                        thank_you_worker,
+                        jobs,
+                        results,
+                        config['sender_email'],
+                        gmail_app_password,
+                        bucket,
+                        first_server if worker == 0 else None
+                    )
+                
+                try:
+                    for _ in range(len(outgoing)):
+                        row_index, name, email_address, error_msg = results.get()
+                        if error_msg:
+                            print(f"Sending thank you to: {name} ({email_address})... ✗ Failed: {error_msg}")
+                            failed_count += 1
+                            # Don't update ThankYouSent on failure
+                            continue
+                        
+                        # Queue Google Sheet update: Mark ThankYouSent with today's date
+                        pending_updates.append({'range': f'H{row_index}', 'values': [[today_date]]})
+                        
+                        print(f"Sending thank you to: {name} ({email_address})... ✓ Sent")
+                        sent_count += 1
+                        
+                        # Flush periodically so a crash loses at most a few writes
+                        if len(pending_updates) >= UPDATE_FLUSH_SIZE:
+                            flush_updates(master_worksheet, pending_updates)
+                finally:
+                    # If we're bailing out early, stop workers from picking up more
+                    while True:
+                        try:
+                            jobs.get_nowait()
+                        except queue.Empty:
+                            break
+                    
+                    # Wait for sends already under way and queue the ones that
+                    # went out, then record everything, even if the run was
+                    # interrupted
+                    executor.shutdown()
+                    while True:
+                        try:
+                            row_index, name, email_address, error_msg = results.get_nowait()
+                        except queue.Empty:
+                            break
+                        if not error_msg:
+                            pending_updates.append({'range': f'H{row_index}', 'values': [[today_date]]})
+                    flush_updates(master_worksheet, pending_updates)
+        
         # Print final summary
         print()
         print("="*60)
@@ -440,6 +671,10 @@ def main():
         print(f"Error: Google Sheets API error: {e}")
     except gspread.exceptions.SpreadsheetNotFound:
         print(f"Error: Google Sheet not found. Please check the sheet_id in config.json.")
+    except smtplib.SMTPAuthenticationError as e:
+        print(f"Error: SMTP Authentication failed: {e}")
+    except smtplib.SMTPException as e:
+        print(f"Error: Could not connect to Gmail SMTP server: {e}")
     except Exception as e:
         print(f"Unexpected error: {type(e).__name__}: {e}")
 
@@ -0,0 +1,75 @@
+"""
+Gmail SMTP Helpers for Grant Tracker
+
+Shared connection code for every script that logs in to Gmail
+(send_batch.py, send_reminders.py, send_thanks.py and the test_gmail.py
+credentials check). All sessions verify Gmail's certificate with one
+default TLS context.
+"""
+
+import functools
+import smtplib
+import ssl
+
+# Gmail SMTP server (STARTTLS submission port)
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 587
+
+# Implicit TLS submission port: the connection starts encrypted and skips
+# the STARTTLS round trip
+SMTP_SSL_PORT = 465
+
+
+@functools.lru_cache(maxsize=None)
+def smtp_ssl_context():
+    """
+    Verifying TLS context shared by every SMTP session.
+    
+    Built on first use, so the CA bundle is loaded once per run (and not at
+    all for --help or dry runs) instead of once per connection.
+    """
+    return ssl.create_default_context()
+
+
+def open_smtp_connection(sender_email, password):
+    """
+    Open an authenticated Gmail SMTP connection over STARTTLS.
+    
+    Args:
+        sender_email (str): Gmail address to log in as
+        password (str): Gmail App Password
+        
+    Returns:
+        smtplib.SMTP: Connected, TLS-encrypted, logged-in SMTP session
+    """
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+    server.ehlo()
+    server.starttls(context=smtp_ssl_context())  # Enable TLS encryption
+    server.ehlo()  # Re-identify over the encrypted channel before AUTH
+    server.login(sender_email, password)
+    return server
+
+
+def open_smtp_ssl_connection(sender_email, password):
+    """
+    Open an authenticated Gmail SMTP connection over implicit TLS (port 465).
+    
+    Args:
+        sender_email (str): Gmail address to log in as
+        password (str): Gmail App Password
+        
+    Returns:
+        smtplib.SMTP_SSL: Connected, TLS-encrypted, logged-in SMTP session
+    """
+    server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_SSL_PORT, context=smtp_ssl_context())
+    server.ehlo()
+    server.login(sender_email, password)
+    return server
+
+
+def close_smtp_connection(server):
+    """Quit an SMTP session, ignoring one that is already closed."""
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        pass  # Connection already closed; nothing left to clean up
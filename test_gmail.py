@@ -1,22 +1,28 @@
-import smtplib
 import os
+
 from dotenv import load_dotenv
 
-load_dotenv()
+from smtp_utils import close_smtp_connection, open_smtp_connection
+
 
-password = os.getenv('GMAIL_APP_PASSWORD')
-email = "wdroberts1608@gmail.com"
+def main():
+    load_dotenv()
+    
+    password = os.getenv('GMAIL_APP_PASSWORD')
+    email = "wdroberts1608@gmail.com"
+    
+    print(f"Email: {email}")
+    print(f"Password found: {'Yes' if password else 'No'}")
+    print(f"Password length: {len(password) if password else 0}")
+    
+    try:
+        server = open_smtp_connection(email, password)
+        print("TLS connection established")
+        print("✓ Authentication successful!")
+        close_smtp_connection(server)
+    except Exception as e:
+        print(f"✗ Authentication failed: {e}")
 
-print(f"Email: {email}")
-print(f"Password found: {'Yes' if password else 'No'}")
-print(f"Password length: {len(password) if password else 0}")
 
-try:
-    server = smtplib.SMTP('smtp.gmail.com', 587)
-    server.starttls()
-    print("TLS connection established")
-    server.login(email, password)
-    print("✓ Authentication successful!")
-    server.quit()
-except Exception as e:
-    print(f"✗ Authentication failed: {e}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Tests for send_batch.read_unsent_rows (span, tail and progress-marker arithmetic).
+
+Run from the project root with: python -m unittest discover tests
+"""
+
+import re
+import unittest
+
+from send_batch import read_unsent_rows
+
+
+class FakeWorksheet:
+    """
+    In-memory stand-in for a gspread Worksheet that trims empty trailing
+    rows and cells the way the Sheets API does.
+    """
+    
+    def __init__(self, rows, row_count=None):
+        # rows[0] is sheet row 1 (the header)
+        self.rows = rows
+        self.row_count = row_count or len(rows)
+    
+    def _read(self, a1_range):
+        first_col, first_row, last_col, last_row = re.match(
+            r'([A-Z])(\d+):([A-Z])(\d*)$', a1_range
+        ).groups()
+        start, stop = ord(first_col) - ord('A'), ord(last_col) - ord('A') + 1
+        end = int(last_row) if last_row else self.row_count
+        values = []
+        for row in self.rows[int(first_row) - 1:end]:
+            cells = list(row[start:stop])
+            while cells and not cells[-1]:
+                cells.pop()
+            values.append(cells)
+        while values and not values[-1]:
+            values.pop()
+        return values
+    
+    def get(self, a1_range):
+        return self._read(a1_range)
+    
+    def batch_get(self, ranges):
+        return [self._read(a1_range) for a1_range in ranges]
+
+
+HEADER = ['Name', 'Email', 'Address', 'ID', 'Status', 'SentDate']
+
+
+def person(n, status=''):
+    return [f'Person {n}', f'p{n}@example.com', '', '', status]
+
+
+class ReadUnsentRowsTest(unittest.TestCase):
+    
+    def test_unsent_rows_merge_into_spans(self):
+        sheet = FakeWorksheet([
+            HEADER,
+            person(2, 'Sent'),
+            person(3),
+            person(4),
+            person(5, 'Sent'),
+            person(6),
+            person(7, 'Sent'),
+        ])
+        rows, more_remaining, next_start_row = read_unsent_rows(sheet, 2, 10)
+        self.assertEqual([row_index for row_index, _ in rows], [3, 4, 6])
+        self.assertEqual(rows[0][1], ['Person 3', 'p3@example.com'])
+        self.assertFalse(more_remaining)
+        self.assertEqual(next_start_row, 8)
+    
+    def test_full_batch_above_tail_resumes_at_next_unsent_row(self):
+        sheet = FakeWorksheet([HEADER] + [person(n) for n in range(2, 6)] + [person(6, 'Sent')])
+        rows, more_remaining, next_start_row = read_unsent_rows(sheet, 2, 2)
+        self.assertEqual([row_index for row_index, _ in rows], [2, 3])
+        self.assertTrue(more_remaining)
+        self.assertEqual(next_start_row, 4)
+    
+    def test_tail_tops_up_batch(self):
+        sheet = FakeWorksheet([
+            HEADER,
+            person(2, 'Sent'),
+            person(3),
+            person(4, 'Sent'),
+            person(5),
+            person(6),
+            person(7),
+        ])
+        rows, more_remaining, next_start_row = read_unsent_rows(sheet, 2, 3)
+        self.assertEqual([row_index for row_index, _ in rows], [3, 5, 6])
+        self.assertTrue(more_remaining)
+        self.assertEqual(next_start_row, 7)
+    
+    def test_blank_row_after_batch_still_reports_more(self):
+        sheet = FakeWorksheet([HEADER, person(2, 'Sent'), person(3), [], person(5)])
+        rows, more_remaining, next_start_row = read_unsent_rows(sheet, 2, 1)
+        self.assertEqual([row_index for row_index, _ in rows], [3])
+        self.assertTrue(more_remaining)
+        self.assertEqual(next_start_row, 5)
+    
+    def test_rows_after_long_blank_gap_are_found(self):
+        sheet = FakeWorksheet([HEADER, person(2, 'Sent')] + [[]] * 20 + [person(23), person(24)])
+        rows, more_remaining, next_start_row = read_unsent_rows(sheet, 3, 5)
+        self.assertEqual([row_index for row_index, _ in rows], [23, 24])
+        self.assertFalse(more_remaining)
+        self.assertEqual(next_start_row, 25)
+    
+    def test_gap_at_top_of_sheet_is_not_empty(self):
+        sheet = FakeWorksheet([HEADER] + [[]] * 10 + [person(12)])
+        rows, more_remaining, next_start_row = read_unsent_rows(sheet, 2, 3)
+        self.assertEqual([row_index for row_index, _ in rows], [12])
+        self.assertFalse(more_remaining)
+        self.assertEqual(next_start_row, 13)
+    
+    def test_no_rows_past_marker(self):
+        sheet = FakeWorksheet([HEADER, person(2, 'Sent'), person(3, 'Sent')], row_count=100)
+        self.assertEqual(read_unsent_rows(sheet, 4, 5), ([], False, 4))
+    
+    def test_marker_past_end_of_sheet(self):
+        sheet = FakeWorksheet([HEADER, person(2, 'Sent')])
+        self.assertEqual(read_unsent_rows(sheet, 3, 5), ([], False, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,18 +7,21 @@ suspicious patterns, DNS failures, and duplicates.
 """
 
 import argparse
+import json
+import math
 import os
 import re
 import socket
+import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import chain
 
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 
-from email_generator import load_config
-
-# Email validation regex pattern
-EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+from email_generator import EMAIL_PATTERN, load_config
 
 # Common test/suspicious domains
 SUSPICIOUS_DOMAINS = [
@@ -26,16 +29,41 @@ SUSPICIOUS_DOMAINS = [
     'invalid', 'fake.com', 'test.org', 'example.net'
 ]
 
-# DNS lookup timeout (seconds)
+# Matches a domain that is, or is a subdomain of, one of the test domains
+SUSPICIOUS_DOMAIN_PATTERN = re.compile(
+    r'(?:^|\.)(' + '|'.join(re.escape(d) for d in SUSPICIOUS_DOMAINS) + r')$'
+)
+
+# Rows fetched per Sheets API read, so only one page of the sheet is in memory
+READ_PAGE_SIZE = 5000
+
+# Well-known mail providers that always resolve; --check-dns skips the lookup
+KNOWN_GOOD_DOMAINS = frozenset([
+    'gmail.com', 'googlemail.com', 'outlook.com', 'hotmail.com', 'live.com',
+    'msn.com', 'yahoo.com', 'icloud.com', 'me.com', 'aol.com', 'proton.me',
+    'protonmail.com', 'comcast.net'
+])
+
+# Number of DNS lookups to run at once with --check-dns
+DNS_MAX_WORKERS = 32
+
+# How long to wait for a single DNS lookup (seconds)
 DNS_TIMEOUT = 5
 
+# Local file remembering domains that resolved, so reruns skip those lookups
+# (kept next to the API token cache, out of the working tree)
+DNS_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'grant_tracker', 'dns_cache.json')
+
+# How long (seconds) a remembered domain is trusted before it is looked up again
+DNS_CACHE_TTL = 24 * 60 * 60
+
 
 def validate_email_format(email):
     """
     Validate email format using regex pattern.
     
     Args:
-        email (str): Email address to validate
+        email (str): Email address to validate (already stripped)
         
     Returns:
         tuple: (is_valid, error_message)
@@ -43,7 +71,10 @@ def validate_email_format(email):
     if not email or not isinstance(email, str):
         return False, "Email is empty or not a string"
     
-    email = email.strip()
+    # Fast path: a pattern match already implies every check below, so the
+    # step-by-step diagnostics only run for invalid addresses
+    if EMAIL_PATTERN.match(email):
+        return True, ""
     
     # Check for spaces
     if ' ' in email:
@@ -78,42 +109,29 @@ def validate_email_format(email):
     if len(domain_parts[-1]) < 2:
         return False, "Domain TLD too short (must be at least 2 characters)"
     
-    # Use regex pattern to validate overall format
-    if not EMAIL_PATTERN.match(email):
-        return False, "Email format does not match standard pattern"
-    
-    return True, ""
+    # Every specific check passed, so the pattern itself rejected it
+    return False, "Email format does not match standard pattern"
 
 
-def is_suspicious_email(email):
+def is_suspicious_email(local_part, domain_part):
     """
-    Check if email matches suspicious/test patterns.
+    Check if a validated email matches suspicious/test patterns.
     
     Args:
-        email (str): Email address to check
+        local_part (str): Lowercased part of the address before the @
+        domain_part (str): Lowercased part of the address after the @
         
     Returns:
         tuple: (is_suspicious, reason)
     """
-    if not email or '@' not in email:
-        return False, ""
-    
-    email_lower = email.lower().strip()
-    parts = email_lower.split('@')
-    
-    if len(parts) != 2:
-        return False, ""
-    
-    local_part = parts[0]
-    domain_part = parts[1]
-    
-    # Check for test domains
-    for test_domain in SUSPICIOUS_DOMAINS:
-        if domain_part == test_domain or domain_part.endswith('.' + test_domain):
-            return True, f"Test domain: {test_domain}"
+    # Check for test domains (the domain itself or any parent domain)
+    test_domain = SUSPICIOUS_DOMAIN_PATTERN.search(domain_part)
+    if test_domain:
+        return True, f"Test domain: {test_domain.group(1)}"
     
     # Check if local part equals domain part (e.g., test@test.com)
-    if local_part == domain_part.split('.')[0]:
+    domain_name = domain_part.partition('.')[0]
+    if local_part == domain_name:
         return True, "Local part matches domain part"
     
     # Check if both parts contain "test"
@@ -121,7 +139,7 @@ def is_suspicious_email(email):
         return True, "Contains 'test' in both local and domain parts"
     
     # Check for repeated patterns (e.g., abc@abc.com)
-    if local_part == domain_part.split('.')[0] and len(local_part) > 2:
+    if local_part == domain_name and len(local_part) > 2:
         return True, "Repeated pattern detected"
     
     return False, ""
@@ -137,21 +155,122 @@ def check_dns(domain):
     Returns:
         tuple: (domain_exists, error_message)
     """
+    # Well-known providers need no network round trip
+    if domain.lower() in KNOWN_GOOD_DOMAINS:
+        return True, ""
+    
     try:
-        # Set socket timeout
-        socket.setdefaulttimeout(DNS_TIMEOUT)
-        
-        # Try to resolve the domain
-        socket.gethostbyname(domain)
+        # Try to resolve the domain (only for address families this host can
+        # use); the timeout is enforced by resolve_domains, not a socket global
+        socket.getaddrinfo(domain, None, 0, 0, 0, socket.AI_ADDRCONFIG)
         return True, ""
     except socket.gaierror:
         return False, "Domain not found (DNS lookup failed)"
-    except socket.timeout:
-        return False, "DNS lookup timed out"
     except Exception as e:
         return False, f"DNS error: {str(e)}"
 
 
+def iter_rows(worksheet):
+    """
+    Yield the Name and Email cells of each data row, one page of rows at a time.
+    
+    The API trims empty rows from the end of each page, so blank rows are
+    filled back in when a later page turns out to have data.
+    
+    Args:
+        worksheet: gspread Worksheet for the master sheet
+        
+    Yields:
+        tuple: (row_index, row) where row holds up to [name, email]
+    """
+    next_index = 2  # Row 1 is header, row 2 is first data row
+    for start in range(2, worksheet.row_count + 1, READ_PAGE_SIZE):
+        end = min(start + READ_PAGE_SIZE - 1, worksheet.row_count)
+        page = worksheet.get(f'A{start}:B{end}')
+        if not page:
+            continue
+        for row_index in range(next_index, start):
+            yield row_index, []
+        yield from enumerate(page, start)
+        next_index = start + len(page)
+
+
+def resolve_domains(domains):
+    """
+    Run check_dns for several domains in parallel under one overall deadline.
+    
+    The deadline allows DNS_TIMEOUT for each round of DNS_MAX_WORKERS lookups.
+    Lookups still running when it passes are reported as timed out; lookups
+    that never got a worker are cancelled and reported as not attempted.
+    
+    Args:
+        domains (list): Domain names to check
+        
+    Returns:
+        dict: domain -> (domain_exists, error_message)
+    """
+    executor = ThreadPoolExecutor(max_workers=DNS_MAX_WORKERS)
+    futures = {domain: executor.submit(check_dns, domain) for domain in domains}
+    rounds = max(1, math.ceil(len(futures) / DNS_MAX_WORKERS))
+    wait(futures.values(), timeout=DNS_TIMEOUT * rounds)
+    
+    # Drop queued lookups and return without joining the ones still running;
+    # their threads exit once getaddrinfo gives up on its own
+    executor.shutdown(wait=False, cancel_futures=True)
+    
+    results = {}
+    timed_out = not_attempted = 0
+    for domain, future in futures.items():
+        if future.cancelled():
+            results[domain] = (False, "DNS lookup not attempted (overall time limit reached)")
+            not_attempted += 1
+        elif future.done():
+            results[domain] = future.result()
+        else:
+            results[domain] = (False, "DNS lookup timed out")
+            timed_out += 1
+    
+    if timed_out or not_attempted:
+        print(f"Warning: {timed_out} DNS lookup(s) timed out and "
+              f"{not_attempted} were not attempted; rerun to retry them")
+    return results
+
+
+def load_dns_cache():
+    """
+    Read the domains that resolved on recent runs from the local cache file.
+    
+    Returns:
+        dict: Domain -> time (epoch seconds) it last resolved, for entries
+            younger than DNS_CACHE_TTL (empty if there is no usable file)
+    """
+    try:
+        with open(DNS_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        cutoff = time.time() - DNS_CACHE_TTL
+        return {domain: float(checked_at) for domain, checked_at in cache.items()
+                if float(checked_at) > cutoff}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def save_dns_cache(cache):
+    """
+    Write resolved domains back to the local cache file.
+    
+    Best effort: failing to write the cache only means more lookups next time.
+    
+    Args:
+        cache (dict): Domain -> time (epoch seconds) it last resolved
+    """
+    try:
+        os.makedirs(os.path.dirname(DNS_CACHE_PATH), exist_ok=True)
+        with open(DNS_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"Warning: Could not save DNS cache: {e}")
+
+
 def main():
     """
     Main function to validate all emails in the Master Sheet.
@@ -219,35 +338,36 @@ def main():
         print(f"Accessing worksheet: {config['master_sheet_tab']}...")
         worksheet = sheet.worksheet(config['master_sheet_tab'])
         
-        # Read all rows from the sheet
+        # Stream only the Name and Email columns, skipping the header row
         print("Reading data from sheet...")
-        all_rows = worksheet.get_all_values()
+        data_rows = iter_rows(worksheet)
+        first_row = next(data_rows, None)
         
-        if len(all_rows) < 2:
+        if first_row is None:
             print("Warning: Sheet appears to be empty or only contains headers.")
             return
         
-        # Column indices based on Master Sheet structure
+        # Column indices within the A:B range read by iter_rows
         NAME_COLUMN = 0      # Column A
         EMAIL_COLUMN = 1     # Column B
         
-        # Skip header row (index 0), process data rows only
-        data_rows = all_rows[1:]
-        
         # Initialize tracking dictionaries
+        total_checked = 0
         valid_emails = []
         invalid_format = []  # List of (row_index, email, error_message)
         missing_emails = []  # List of (row_index, name)
         suspicious_emails = []  # List of (row_index, email, reason)
         dns_failures = []  # List of (row_index, email, error_message)
-        email_to_rows = defaultdict(list)  # Map email to list of row indices
+        dns_checks = []  # List of (row_index, email, domain) to look up
+        email_seen = {}  # Map email to its first (row_index, email)
+        email_dups = defaultdict(list)  # Map repeated email to all its row indices
         
         print("Validating emails...")
         print()
         
         # Process each data row
-        for i, row in enumerate(data_rows):
-            row_index = i + 2  # Row 1 is header, row 2 is first data row
+        for row_index, row in chain([first_row], data_rows):
+            total_checked += 1
             
             # Extract name
             name = ""
@@ -266,7 +386,13 @@ def main():
             
             # Track email for duplicate detection (normalize to lowercase)
             email_lower = email.lower()
-            email_to_rows[email_lower].append((row_index, name, email))
+            if email_lower in email_seen:
+                dup_rows = email_dups[email_lower]
+                if not dup_rows:
+                    dup_rows.append(email_seen[email_lower][0])
+                dup_rows.append(row_index)
+            else:
+                email_seen[email_lower] = (row_index, email)
             
             # Validate email format
             is_valid, error_msg = validate_email_format(email)
@@ -274,92 +400,112 @@ def main():
                 invalid_format.append((row_index, email, error_msg))
                 continue
             
+            # A valid address has exactly one @, so split the lowercased copy
+            # once and share the parts with the checks below
+            local_part, _, domain_part = email_lower.partition('@')
+            
             # Check for suspicious patterns
-            is_suspicious, suspicious_reason = is_suspicious_email(email)
+            is_suspicious, suspicious_reason = is_suspicious_email(local_part, domain_part)
             if is_suspicious:
                 suspicious_emails.append((row_index, email, suspicious_reason))
             
-            # Optional DNS check
+            # Optional DNS check (resolved below, once per domain)
             if args.check_dns:
-                domain = email.split('@')[1]
-                domain_exists, dns_error = check_dns(domain)
-                if not domain_exists:
-                    dns_failures.append((row_index, email, dns_error))
+                dns_checks.append((row_index, email, domain_part))
             
             # If we got here, email is valid
             valid_emails.append((row_index, email))
         
-        # Detect duplicates
-        duplicate_emails = []
-        for email_lower, rows_list in email_to_rows.items():
-            if len(rows_list) > 1:
-                # Extract row indices and original email
-                row_indices = [r[0] for r in rows_list]
-                original_email = rows_list[0][2]  # Get original case email
-                duplicate_emails.append((original_email, row_indices))
-        
-        # Generate report
-        print("="*60)
-        print("Summary Statistics:")
-        print("="*60)
-        total_checked = len(data_rows)
-        print(f"Total emails checked: {total_checked}")
-        print(f"Valid emails: {len(valid_emails)}")
-        print(f"Invalid format: {len(invalid_format)}")
-        print(f"Missing emails: {len(missing_emails)}")
-        print(f"Suspicious/test emails: {len(suspicious_emails)}")
+        # Resolve each unique domain once, with the lookups running in parallel.
+        # Domains that resolved within DNS_CACHE_TTL on an earlier run are
+        # trusted as-is; failures are always looked up again.
+        if dns_checks:
+            dns_cache = load_dns_cache()
+            domains = {domain for _, _, domain in dns_checks}
+            dns_results = {domain: (True, "") for domain in domains if domain in dns_cache}
+            to_resolve = [domain for domain in domains if domain not in dns_cache]
+            if to_resolve:
+                dns_results.update(resolve_domains(to_resolve))
+                now = time.time()
+                dns_cache.update((domain, now) for domain in to_resolve if dns_results[domain][0])
+                save_dns_cache(dns_cache)
+            for row_index, email, domain in dns_checks:
+                domain_exists, dns_error = dns_results[domain]
+                if not domain_exists:
+                    dns_failures.append((row_index, email, dns_error))
+        
+        # Detect duplicates (email_dups only holds emails seen more than once;
+        # report them in order of first appearance)
+        duplicate_emails = [
+            (email_seen[email_lower][1], row_indices)  # Original case email
+            for email_lower, row_indices in sorted(
+                email_dups.items(), key=lambda item: item[1][0]
+            )
+        ]
+        
+        # Generate report, buffered and written out in one go at the end
+        report = []
+        line = report.append
+        line("="*60)
+        line("Summary Statistics:")
+        line("="*60)
+        line(f"Total emails checked: {total_checked}")
+        line(f"Valid emails: {len(valid_emails)}")
+        line(f"Invalid format: {len(invalid_format)}")
+        line(f"Missing emails: {len(missing_emails)}")
+        line(f"Suspicious/test emails: {len(suspicious_emails)}")
         if args.check_dns:
-            print(f"DNS failures: {len(dns_failures)}")
-        print(f"Duplicate emails: {len(duplicate_emails)}")
-        print()
+            line(f"DNS failures: {len(dns_failures)}")
+        line(f"Duplicate emails: {len(duplicate_emails)}")
+        line("")
         
         # Detailed issues
-        print("="*60)
-        print("Detailed Issues:")
-        print("="*60)
-        print()
+        line("="*60)
+        line("Detailed Issues:")
+        line("="*60)
+        line("")
         
         # Invalid format
         if invalid_format:
-            print("INVALID FORMAT:")
+            line("INVALID FORMAT:")
             for row_index, email, error_msg in invalid_format:
-                print(f"  Row {row_index}: {email} ({error_msg})")
-            print()
+                line(f"  Row {row_index}: {email} ({error_msg})")
+            line("")
         
         # Missing emails
         if missing_emails:
-            print("MISSING EMAILS:")
+            line("MISSING EMAILS:")
             for row_index, name in missing_emails:
                 name_display = name if name else "(no name)"
-                print(f"  Row {row_index}: {name_display} (empty email field)")
-            print()
+                line(f"  Row {row_index}: {name_display} (empty email field)")
+            line("")
         
         # Suspicious emails
         if suspicious_emails:
-            print("SUSPICIOUS/TEST EMAILS:")
+            line("SUSPICIOUS/TEST EMAILS:")
             for row_index, email, reason in suspicious_emails:
-                print(f"  Row {row_index}: {email} ({reason})")
-            print()
+                line(f"  Row {row_index}: {email} ({reason})")
+            line("")
         
         # DNS failures
         if args.check_dns and dns_failures:
-            print("DNS FAILURES (--check-dns enabled):")
+            line("DNS FAILURES (--check-dns enabled):")
             for row_index, email, error_msg in dns_failures:
-                print(f"  Row {row_index}: {email} ({error_msg})")
-            print()
+                line(f"  Row {row_index}: {email} ({error_msg})")
+            line("")
         
         # Duplicate emails
         if duplicate_emails:
-            print("DUPLICATE EMAILS:")
+            line("DUPLICATE EMAILS:")
             for email, row_indices in duplicate_emails:
                 rows_str = ", ".join(str(r) for r in row_indices)
-                print(f"  {email} appears in rows: {rows_str}")
-            print()
+                line(f"  {email} appears in rows: {rows_str}")
+            line("")
         
         # Recommendations
-        print("="*60)
-        print("Recommendations:")
-        print("="*60)
+        line("="*60)
+        line("Recommendations:")
+        line("="*60)
         recommendations = []
         
         if invalid_format:
@@ -378,12 +524,13 @@ def main():
             recommendations.append(f"Remove or update {len(duplicate_emails)} duplicate email(s)")
         
         if not recommendations:
-            print("✓ All emails are valid! No issues found.")
+            line("✓ All emails are valid! No issues found.")
         else:
             for rec in recommendations:
-                print(f"- {rec}")
+                line(f"- {rec}")
         
-        print("="*60)
+        line("="*60)
+        sys.stdout.write("\n".join(report) + "\n")
         
     except FileNotFoundError as e:
         print(f"Error: {e}")